@@ -0,0 +1,175 @@
+"""
+Офлайн-бенчмарки горячих путей клиента.
+
+    python -m benchmarks.run --size 1000 --repeat 5 --output results.json
+
+Каждый замер - лучший из repeat прогонов; пиковая память меряется
+tracemalloc отдельным прогоном.
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable
+
+from finolog.models.transaction import Transaction, TransactionGetArgs
+from finolog.repository import ApiManager
+from finolog.services.manager import Manager
+from finolog.testing import FakeFinolog, transaction
+
+BIZ_ID = 1
+
+
+def result(name: str, ops: int, seconds: float, peak: int) -> dict[str, Any]:
+    return {
+        "name": name,
+        "ops": ops,
+        "seconds": seconds,
+        "per_op_us": seconds / ops * 1e6,
+        "ops_per_sec": ops / seconds if seconds else None,
+        "peak_kib": peak / 1024,
+    }
+
+
+async def measure(
+    name: str, ops: int, repeat: int, call: Callable[[], Awaitable[Any]]
+) -> dict[str, Any]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await call()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    await call()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result(name, ops, best, peak)
+
+
+async def run(size: int, repeat: int, concurrency: int) -> list[dict]:
+    fake = FakeFinolog(size)
+    Manager.session = fake.client()
+    manager = Manager(BIZ_ID)
+    results = []
+
+    async def manager_init():
+        for _ in range(1000):
+            Manager(BIZ_ID)
+
+    results.append(
+        await measure("Manager.__init__", 1000, repeat, manager_init)
+    )
+
+    get_args = {
+        "ids": (1, 2, 3),
+        "date": (
+            datetime.datetime(2023, 1, 1),
+            datetime.datetime(2023, 12, 31),
+        ),
+        "status": "regular",
+        "page": 1,
+        "pagesize": 100,
+    }
+
+    async def encode_args():
+        for _ in range(1000):
+            TransactionGetArgs.model_validate(get_args).as_params()
+
+    results.append(
+        await measure("arguments.encode", 1000, repeat, encode_args)
+    )
+
+    rows = [transaction(id) for id in range(1, size + 1)]
+    transactions = manager.transactions
+
+    async def parse_model():
+        [Transaction(_manager=transactions, **row) for row in rows]
+
+    async def parse_lazy():
+        [Transaction.lazy(transactions, row) for row in rows]
+
+    results.append(await measure("parse.model", size, repeat, parse_model))
+    results.append(await measure("parse.lazy", size, repeat, parse_lazy))
+
+    api = ApiManager(Manager.session, BIZ_ID, coalesce=False)
+
+    async def api_requests():
+        await asyncio.gather(
+            *(
+                api.request("GET", f"/transaction/{id}")
+                for id in range(1, concurrency * 10 + 1)
+            )
+        )
+
+    results.append(
+        await measure(
+            "ApiManager.request", concurrency * 10, repeat, api_requests
+        )
+    )
+
+    for name, call in (
+        ("transactions", lambda: manager.transactions.get_list()),
+        ("accounts", lambda: manager.accounts.get_list()),
+        ("companies", lambda: manager.companies.get_list()),
+        ("contractors", lambda: manager.contractors.get_list()),
+        ("orders", lambda: manager.orders.get_list()),
+    ):
+        results.append(await measure(f"{name}.get_list", size, repeat, call))
+
+    async def iter_all():
+        async for _ in manager.transactions.iter_all(pagesize=100):
+            pass
+
+    results.append(
+        await measure("transactions.iter_all", size, repeat, iter_all)
+    )
+
+    async def create_transactions():
+        for _ in range(100):
+            await manager.transactions.create(
+                from_id=1, date=datetime.date(2023, 1, 1), value=100
+            )
+
+    async def create_contractors():
+        for _ in range(100):
+            await manager.contractors.create("Контрагент")
+
+    results.append(
+        await measure("transactions.create", 100, repeat, create_transactions)
+    )
+    results.append(
+        await measure("contractors.create", 100, repeat, create_contractors)
+    )
+
+    await Manager.close()
+    return results
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--output", help="файл для JSON, по умолчанию stdout")
+    args = parser.parse_args(argv)
+
+    report = {
+        "python": platform.python_version(),
+        "size": args.size,
+        "repeat": args.repeat,
+        "results": asyncio.run(run(args.size, args.repeat, args.concurrency)),
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2, ensure_ascii=False)
+    else:
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+
+
+if __name__ == "__main__":
+    main()
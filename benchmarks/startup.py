@@ -0,0 +1,70 @@
+"""
+Бюджет холодного старта: импорт finolog.services.manager и первое
+обращение к менеджеру транзакций в чистом интерпретаторе.
+
+    python -m benchmarks.startup --budget 0.5 --repeat 5
+
+Замер - медиана repeat запусков; код возврата 1, если импорт или
+импорт вместе с первым обращением не уложились в budget секунд.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PROBE = """
+import time
+start = time.perf_counter()
+from finolog.services.manager import Manager
+imported = time.perf_counter() - start
+loaded = sorted(name for name in __import__("sys").modules
+                if name.startswith("finolog.models."))
+Manager.session = object()
+Manager(1).transactions
+first = time.perf_counter() - start
+print(__import__("json").dumps([imported, first, loaded]))
+"""
+
+
+def probe() -> tuple[float, float, list[str]]:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    imported, first, loaded = json.loads(output)
+    return imported, first, loaded
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget", type=float, default=0.5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    runs = [probe() for _ in range(args.repeat)]
+    report = {
+        "import_s": statistics.median(run[0] for run in runs),
+        "first_access_s": statistics.median(run[1] for run in runs),
+        "models_on_import": runs[0][2],
+        "budget_s": args.budget,
+    }
+    json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+    print()
+    if report["models_on_import"]:
+        print("Импорт Manager тянет модули моделей", file=sys.stderr)
+        return 1
+    if report["first_access_s"] > args.budget:
+        print("Холодный старт не уложился в бюджет", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
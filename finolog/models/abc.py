@@ -1,19 +1,194 @@
-from typing import Generic, Self, TypeVar
+import asyncio
+import copy
+import weakref
+from abc import ABC, abstractmethod
+from collections import deque
+from functools import cache
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    AsyncIterator,
+    Generic,
+    Hashable,
+    Literal,
+    TYPE_CHECKING,
+    Protocol,
+    Self,
+    TypeVar,
+)
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, PrivateAttr, TypeAdapter
 
+from finolog.models.cache import EntityCache
 from finolog.repository import ApiManager
 
+if TYPE_CHECKING:
+    from finolog.models.arguments import Arguments
+    from finolog.models.parsing import PoolParser
+
 T = TypeVar("T")
 
+RecordMode = Literal["model", "lazy", "raw"]
+
+
+class Listener(Protocol):
+    """Подписчик на изменения, сделанные через менеджер"""
+
+    def written(self, record: Any):
+        ...
+
+    def removed(self, id: int):
+        ...
+
+
+class Subscriber(ABC):
+    """
+    Локальный индекс записей, который подключается к менеджеру как
+    Listener: записанное через менеджер передаётся в add, удалённое - в
+    remove
+    """
+
+    def attach(self, manager: "BaseManager"):
+        manager.listeners.append(self)
+
+    def detach(self, manager: "BaseManager"):
+        manager.listeners.remove(self)
+
+    @abstractmethod
+    def add(self, record: Any):
+        ...
+
+    @abstractmethod
+    def remove(self, id: int):
+        ...
+
+    def written(self, record: Any):
+        self.add(record)
+
+    def removed(self, id: int):
+        self.remove(id)
+
 
 class BaseManager(Generic[T]):
-    biz_managers: dict[int, Self] = {}
+    biz_managers: "weakref.WeakValueDictionary[int, Self]" = (
+        weakref.WeakValueDictionary()
+    )
+    cache_size: int = 1024
+    cache_ttl: float = 300.0
+    record_mode: RecordMode = "model"
+    parser: "PoolParser | None" = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Свой реестр у каждого вида менеджеров, иначе менеджеры одного
+        # бизнеса перетирают друг друга
+        cls.biz_managers = weakref.WeakValueDictionary()
 
-    def __init__(self: Self, api_manager: ApiManager):
+    def __init__(
+        self: Self, api_manager: ApiManager, cache: EntityCache | None = None
+    ):
         self.api_manager: ApiManager = api_manager
+        self.cache = cache
+        self.listeners: list[Listener] = []
         self.biz_managers[api_manager.biz_id] = self
 
+    def using(self, mode: RecordMode) -> Self:
+        """
+        Копия менеджера, которая строит записи в режиме mode:
+        model - полная валидация, lazy - валидация поля при первом
+        обращении, raw - словари из ответа как есть
+        """
+        manager = copy.copy(self)
+        manager.record_mode = mode
+        return manager
+
+    def build(self, record: type["Record"], data: dict[str, Any]) -> Any:
+        if self.record_mode == "raw":
+            return data
+        if self.record_mode == "lazy":
+            return record.lazy(self, data)
+        return record(_manager=self, **data)
+
+    async def request_list(
+        self, record: type["Record"], path: str, args: "Arguments | None"
+    ) -> list:
+        """
+        GET списка с построением записей на месте или в parser - только
+        в режиме model: lazy и raw дешевле построить сразу
+        """
+        if self.parser is None or self.record_mode != "model":
+            return await self.api_manager.request(
+                "GET",
+                path,
+                args,
+                parse=lambda rows: [self.build(record, row) for row in rows],
+            )
+        rows = await self.api_manager.request("GET", path, args)
+        return await self.parser.parse(self, record, rows)
+
+    def stream_list(
+        self, record: type["Record"], path: str, args: "Arguments | None"
+    ) -> AsyncIterator:
+        if self.parser is None or self.record_mode != "model":
+            return self.api_manager.stream(
+                path, args, parse=lambda row: self.build(record, row)
+            )
+        return self.parser.stream(
+            self, record, self.api_manager.stream(path, args)
+        )
+
+    @classmethod
+    def make_cache(cls) -> EntityCache:
+        return EntityCache(maxsize=cls.cache_size, ttl=cls.cache_ttl)
+
+    @staticmethod
+    def list_key(args: dict[str, Any]) -> tuple[str, str]:
+        return ("list", repr(sorted(args.items())))
+
+    def cached(self, key: Hashable) -> Any | None:
+        """
+        Копия из кэша: изменения, которые один вызывающий ещё не
+        сохранил, не должны попасть в save() другого
+        """
+        value = None if self.cache is None else self.cache.get(key)
+        if isinstance(value, tuple):
+            return tuple(map(copy.copy, value))
+        return copy.copy(value)
+
+    def store(self, record: T) -> T:
+        if self.cache is not None:
+            self.cache.set(
+                record.id, copy.copy(record)  # type: ignore[attr-defined]
+            )
+        return record
+
+    def store_list(self, key: Hashable, records: list[T]) -> list[T]:
+        if self.cache is not None:
+            copies = tuple(map(copy.copy, records))
+            for record in copies:
+                self.cache.set(record.id, record)  # type: ignore
+            self.cache.set(key, copies)
+        return records
+
+    def invalidate(self, id: int | None = None):
+        if self.cache is not None:
+            self.cache.invalidate(id)
+
+    def written(self, record: T, created: bool = False) -> T:
+        """Вызывается после create/update: кэш и подписчики"""
+        self.invalidate(None if created else record.id)  # type: ignore
+        self.store(record)
+        for listener in self.listeners:
+            listener.written(record)
+        return record
+
+    def removed(self, id: int):
+        """Вызывается после delete"""
+        self.invalidate(id)
+        for listener in self.listeners:
+            listener.removed(id)
+
     async def get_list(self, **args) -> list[T]:
         raise NotImplementedError()
 
@@ -30,25 +205,190 @@ class BaseManager(Generic[T]):
         raise NotImplementedError()
 
 
+class PaginatedManager(BaseManager[T]):
+    """Менеджер сущностей, список которых отдаётся постранично"""
+
+    pagesize: int = 100
+    prefetch: int = 4
+
+    async def iter_all(
+        self,
+        *,
+        pagesize: int | None = None,
+        prefetch: int | None = None,
+        **args,
+    ) -> AsyncIterator[T]:
+        """
+        Обходит все страницы get_list, держа в полёте до prefetch запросов.
+        Первая страница запрашивается одна, так что короткий список стоит
+        одного запроса. Записи отдаются в порядке страниц; обход
+        заканчивается на первой неполной странице.
+        """
+        pagesize = pagesize or self.pagesize
+        prefetch = max(1, prefetch or self.prefetch)
+        page: int = args.pop("page", 1)
+        pending: deque[asyncio.Task[list[T]]] = deque()
+
+        def schedule():
+            nonlocal page
+            pending.append(
+                asyncio.ensure_future(
+                    self.get_list(page=page, pagesize=pagesize, **args)
+                )
+            )
+            page += 1
+
+        try:
+            schedule()
+            while pending:
+                records = await pending.popleft()
+                last = len(records) < pagesize
+                if not last:
+                    while len(pending) < prefetch:
+                        schedule()
+                for record in records:
+                    yield record
+                if last:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
 ManagerType = TypeVar("ManagerType", bound=BaseManager)
 
 
+@cache
+def field_adapter(model: type[BaseModel], name: str) -> TypeAdapter:
+    field = model.model_fields[name]
+    annotation: Any = field.annotation
+    if field.metadata:
+        annotation = Annotated[(annotation, *field.metadata)]
+    return TypeAdapter(annotation)
+
+
 class Record(BaseModel, Generic[ManagerType]):
     """Отвечает за работу с записями"""
 
+    # Схема валидации строится при первой записи, а не при импорте
+    model_config = ConfigDict(defer_build=True)
+
+    writable: ClassVar[frozenset[str] | None] = None
+
     id: int
     _manager: ManagerType
+    _raw: dict[str, Any] | None = None
+    _dirty: set[str] = PrivateAttr(default_factory=set)
 
     def __init__(self, _manager: ManagerType, **data):
         super().__init__(**data)
         self._manager = _manager
 
+    @classmethod
+    def lazy(cls, _manager: ManagerType, data: dict[str, Any]) -> Self:
+        """
+        Запись без валидации: поля проверяются при первом обращении.
+        Данные считаются доверенными, лишние ключи отбрасываются.
+        """
+        record = cls.__new__(cls)
+        object.__setattr__(record, "__dict__", {"id": data["id"]})
+        object.__setattr__(
+            record,
+            "__pydantic_fields_set__",
+            set(data) & cls.model_fields.keys(),
+        )
+        object.__setattr__(record, "__pydantic_extra__", None)
+        object.__setattr__(
+            record,
+            "__pydantic_private__",
+            {"_manager": _manager, "_raw": data, "_dirty": set()},
+        )
+        return record
+
+    def __getattr__(self, name: str) -> Any:
+        private = object.__getattribute__(self, "__pydantic_private__")
+        raw = private.get("_raw") if private else None
+        if raw is None or name not in type(self).model_fields:
+            return super().__getattr__(name)  # type: ignore[misc]
+        if name in raw:
+            value = field_adapter(type(self), name).validate_python(raw[name])
+        else:
+            field = type(self).model_fields[name]
+            if field.is_required():
+                raise AttributeError(f"Поле {name} отсутствует в ответе")
+            value = field.get_default(call_default_factory=True)
+        self.__dict__[name] = value
+        return value
+
+    def __copy__(self) -> Self:
+        """Неглубокая копия со своим набором изменённых полей"""
+        record = type(self).__new__(type(self))
+        object.__setattr__(record, "__dict__", self.__dict__.copy())
+        object.__setattr__(
+            record,
+            "__pydantic_fields_set__",
+            set(self.__pydantic_fields_set__),
+        )
+        object.__setattr__(
+            record, "__pydantic_extra__", self.__pydantic_extra__
+        )
+        private = dict(self.__pydantic_private__ or ())
+        private["_dirty"] = set(private.get("_dirty", ()))
+        object.__setattr__(record, "__pydantic_private__", private)
+        return record
+
+    def __setattr__(self, name: str, value: Any):
+        if name in type(self).model_fields:
+            writable = type(self).writable
+            if writable is not None and name not in writable:
+                raise ValueError(f"Поле нельзя изменить: {name}")
+            super().__setattr__(name, value)
+            self._dirty.add(name)
+        else:
+            super().__setattr__(name, value)
+
+    @property
+    def dirty(self) -> frozenset[str]:
+        """Поля, изменённые присваиванием после загрузки или save()"""
+        return frozenset(self._dirty)
+
+    def changes(self) -> dict[str, Any]:
+        writable = type(self).writable
+        if writable is not None and not self._dirty <= writable:
+            fields = ", ".join(sorted(self._dirty - writable))
+            raise ValueError(f"Поля нельзя изменить: {fields}")
+        return {name: self.__dict__[name] for name in self._dirty}
+
+    def materialize(self) -> Self:
+        """Валидирует все ещё не проверенные поля ленивой записи"""
+        if self._raw is not None:
+            for name in type(self).model_fields.keys() - self.__dict__.keys():
+                getattr(self, name)
+            self._raw = None
+        return self
+
+    def model_dump(self, **kwargs) -> dict[str, Any]:
+        return super(Record, self.materialize()).model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs) -> str:
+        return super(Record, self.materialize()).model_dump_json(**kwargs)
+
     async def update(self, **args):
-        a = self.model_dump(exclude_none=True)
+        """PUT изменённых полей вместе с args"""
+        a = self.changes()
         a.update(args)
-        response = await self._manager.update(**a)
-        self.__dict__ = response.__dict__
+        response = await self._manager.update(self.id, **a)
+        self.__dict__ = dict(response.__dict__)
+        self._raw = None
+        self._dirty.clear()
         return response
 
+    async def save(self) -> Self:
+        """Отправляет только изменённые поля; без изменений запроса нет"""
+        if self._dirty:
+            await self.update()
+        return self
+
     async def delete(self):
         return await self._manager.delete(self.id)
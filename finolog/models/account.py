@@ -1,5 +1,3 @@
-from typing import Any
-
 from pydantic import BaseModel
 
 from finolog.models.abc import BaseManager, Record
@@ -8,16 +6,30 @@ from finolog.models.company import Summary
 
 
 class AccountManager(BaseManager["Account"]):
+    cache_ttl = 300.0
+
     async def get(self, id: int):
-        account = await self.api_manager.request("GET", f"/account/{id}")
-        return Account(_manager=self, **account)
+        if (cached := self.cached(id)) is not None:
+            return cached
+        account = await self.api_manager.request(
+            "GET",
+            f"/account/{id}",
+            parse=lambda account: Account(_manager=self, **account),
+        )
+        return self.store(account)
 
     async def get_list(self, **args) -> list["Account"]:
-        accounts: list[dict[str, Any]] = await self.api_manager.request(
+        key = self.list_key(args)
+        if (cached := self.cached(key)) is not None:
+            return list(cached)
+        accounts: list[Account] = await self.api_manager.request(
             "GET",
             "/account",
+            parse=lambda accounts: [
+                Account(_manager=self, **account) for account in accounts
+            ],
         )
-        return [Account(_manager=self, **account) for account in accounts]
+        return self.store_list(key, accounts)
 
 
 class Account(Record[AccountManager], BaseModel):
@@ -1,11 +1,38 @@
-from typing import TypedDict
+from functools import cache
+from typing import Any, Mapping, Self
 
-from pydantic import RootModel
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict
 
 
-class Arguments(RootModel):
+class Arguments:
+    """
+    Аргументы запроса. Схема ArgDict компилируется один раз на класс
+    при первом использовании.
+    """
+
     class ArgDict(TypedDict):
         ...
 
-    def __new__(cls, *args, **kwargs):
-        return RootModel(cls.ArgDict)
+    __slots__ = ("root",)
+
+    def __init__(self, root: Mapping[str, Any]):
+        self.root = root
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.root!r})"
+
+    @classmethod
+    @cache
+    def adapter(cls) -> TypeAdapter:
+        return TypeAdapter(cls.ArgDict)
+
+    @classmethod
+    def model_validate(cls, obj: Mapping[str, Any]) -> Self:
+        return cls(cls.adapter().validate_python(obj))
+
+    def as_params(self) -> dict[str, Any]:
+        """Параметры для query-string или формы"""
+        return self.adapter().dump_python(
+            self.root, mode="json", by_alias=True, exclude_none=True
+        )
@@ -0,0 +1,43 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generic, Iterable, TypeVar
+
+A = TypeVar("A")
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class BulkResult(Generic[T]):
+    """Результат одной операции пакета"""
+
+    args: Any
+    result: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def run_many(
+    call: Callable[[A], Awaitable[T]],
+    items: Iterable[A],
+    concurrency: int,
+) -> list[BulkResult[T]]:
+    """
+    Выполняет call для каждого элемента не более чем в concurrency потоков.
+    Ошибка одного элемента не останавливает остальные; результаты идут в
+    порядке входных данных.
+    """
+    results: dict[int, BulkResult[T]] = {}
+    queue = iter(enumerate(items))
+
+    async def worker():
+        for index, item in queue:
+            try:
+                results[index] = BulkResult(item, await call(item))
+            except Exception as e:
+                results[index] = BulkResult(item, error=e)
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return [results[index] for index in range(len(results))]
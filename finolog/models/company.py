@@ -9,17 +9,30 @@ from finolog.models.utils import Datetime, Decimal
 
 
 class CompanyManager(BaseManager["Company"]):
+    cache_ttl = 3600.0
+
     async def get(self, id: int):
-        company = await self.api_manager.request("GET", f"/company/{id}")
-        return Company(_manager=self, **company)
+        if (cached := self.cached(id)) is not None:
+            return cached
+        company = await self.api_manager.request(
+            "GET",
+            f"/company/{id}",
+            parse=lambda company: Company(_manager=self, **company),
+        )
+        return self.store(company)
 
     async def get_list(self, **args) -> list["Company"]:
-        companies: list[dict[str, Any]] = await self.api_manager.request(
+        key = self.list_key(args)
+        if (cached := self.cached(key)) is not None:
+            return list(cached)
+        companies: list[Company] = await self.api_manager.request(
             "GET",
             "/company",
+            parse=lambda companies: [
+                Company(_manager=self, **company) for company in companies
+            ],
         )
-        # return companies
-        return [Company(_manager=self, **company) for company in companies]
+        return self.store_list(key, companies)
 
 
 class Summary(BaseModel):
@@ -1,9 +1,10 @@
 import datetime
-from typing import Any, NotRequired, TypedDict, Unpack
+from typing import Any, NotRequired, Unpack
 
 from pydantic import BaseModel
+from typing_extensions import TypedDict
 
-from finolog.models.abc import BaseManager, Record
+from finolog.models.abc import PaginatedManager, Record
 from finolog.models.transaction import TransactionStatus, TransactionType
 from finolog.models.utils import Datetime, Decimal
 from finolog.models.arguments import Arguments
@@ -24,20 +25,39 @@ class ContractorPostArgs(Arguments):
 class ItemArgs(Arguments):
     class ArgDict(TypedDict):
         query: NotRequired[str]
+        page: NotRequired[int]
+        pagesize: NotRequired[int]
 
 
-class ContractorManager(BaseManager["Contractor"]):
+class ContractorManager(PaginatedManager["Contractor"]):
+    cache_ttl = 600.0
+
     async def get(self, id: int):
-        company = await self.api_manager.request("GET", f"/contractor/{id}")
-        return Contractor(_manager=self, **company)
+        if (cached := self.cached(id)) is not None:
+            return cached
+        contractor = await self.api_manager.request(
+            "GET",
+            f"/contractor/{id}",
+            parse=lambda contractor: Contractor(_manager=self, **contractor),
+        )
+        return self.store(contractor)
 
     async def get_list(
         self, **args: Unpack[ItemArgs.ArgDict]
     ) -> list["Contractor"]:
-        orders: list[dict[str, Any]] = await self.api_manager.request(
-            "GET", "/contractor", ItemArgs.model_validate(args)
+        key = self.list_key(args)  # type: ignore[arg-type]
+        if (cached := self.cached(key)) is not None:
+            return list(cached)
+        contractors: list[Contractor] = await self.api_manager.request(
+            "GET",
+            "/contractor",
+            ItemArgs.model_validate(args),
+            parse=lambda contractors: [
+                Contractor(_manager=self, **contractor)
+                for contractor in contractors
+            ],
         )
-        return [Contractor(_manager=self, **order) for order in orders]
+        return self.store_list(key, contractors)
 
     async def create(self, name):
         c = await self.api_manager.request(
@@ -45,7 +65,7 @@ class ContractorManager(BaseManager["Contractor"]):
             "/contractor",
             ContractorPostArgs.model_validate({"name": name}),
         )
-        return Contractor(_manager=self, **c)
+        return self.written(Contractor(_manager=self, **c), created=True)
 
 
 class Contractor(Record["ContractorManager"], BaseModel):
@@ -0,0 +1,226 @@
+import asyncio
+import csv
+import os
+import types
+from decimal import Decimal
+from typing import (
+    IO,
+    Annotated,
+    Any,
+    AsyncIterator,
+    Callable,
+    Literal,
+    Protocol,
+    Sequence,
+    Union,
+    get_args,
+    get_origin,
+)
+
+import ujson
+from pydantic import BaseModel
+
+from finolog.models.abc import field_adapter
+
+Format = Literal["csv", "ndjson", "parquet"]
+Target = str | os.PathLike | IO
+
+NUMBERS = frozenset((int, float, Decimal))
+
+
+def serializer(
+    model: type[BaseModel], columns: Sequence[str]
+) -> Callable[[Any], dict[str, Any]]:
+    """
+    Строка выгрузки из записи. Значения сериализуются типами полей
+    модели, как в model_dump(mode="json"): Decimal - числом, Datetime -
+    строкой из finolog.models.utils. У ленивых записей проверяются
+    только выгружаемые поля.
+    """
+    adapters = [(name, field_adapter(model, name)) for name in columns]
+    return lambda record: {
+        name: adapter.dump_python(getattr(record, name), mode="json")
+        for name, adapter in adapters
+    }
+
+
+class Writer(Protocol):
+    """Запись пачек строк выгрузки в открытый файл"""
+
+    binary: bool
+
+    def __init__(
+        self, file: IO, columns: Sequence[str], model: type[BaseModel]
+    ):
+        ...
+
+    def write(self, rows: list[dict[str, Any]]):
+        ...
+
+    def close(self):
+        ...
+
+
+def cell(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return ujson.dumps(value, ensure_ascii=False)
+    return value
+
+
+class CsvWriter:
+    binary = False
+
+    def __init__(
+        self, file: IO, columns: Sequence[str], model: type[BaseModel]
+    ):
+        self.writer = csv.writer(file)
+        self.writer.writerow(columns)
+
+    def write(self, rows: list[dict[str, Any]]):
+        self.writer.writerows(
+            [cell(value) for value in row.values()] for row in rows
+        )
+
+    def close(self):
+        pass
+
+
+class NdjsonWriter:
+    binary = False
+
+    def __init__(
+        self, file: IO, columns: Sequence[str], model: type[BaseModel]
+    ):
+        self.file = file
+
+    def write(self, rows: list[dict[str, Any]]):
+        self.file.write(
+            "".join(
+                ujson.dumps(row, ensure_ascii=False) + "\n" for row in rows
+            )
+        )
+
+    def close(self):
+        pass
+
+
+def kinds(annotation: Any) -> set[type]:
+    """Типы значений аннотации без Annotated, Union и None"""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return kinds(get_args(annotation)[0])
+    if origin is Union or origin is types.UnionType:
+        return set().union(*map(kinds, get_args(annotation)))
+    if annotation is None or annotation is type(None):
+        return set()
+    return {origin or annotation}
+
+
+class ParquetWriter:
+    """
+    Схема берётся из аннотаций полей: числа - int64 или float64, bool -
+    bool, остальное - строки (вложенные структуры - JSON). Каждая пачка
+    пишется отдельной группой строк, так что её размер задаёт batch
+    в export.
+    """
+
+    binary = True
+
+    def __init__(
+        self, file: IO, columns: Sequence[str], model: type[BaseModel]
+    ):
+        try:
+            import pyarrow as pa  # type: ignore[import]
+            import pyarrow.parquet as pq  # type: ignore[import]
+        except ImportError as e:  # pragma: no cover
+            raise ImportError(
+                "Для выгрузки в Parquet нужен pyarrow: "
+                "pip install finolog-api-wrapper[parquet]"
+            ) from e
+
+        self.pa = pa
+        fields = []
+        self.text = []
+        for name in columns:
+            found = kinds(model.model_fields[name].annotation)
+            if found and found <= {bool}:
+                type_ = pa.bool_()
+            elif found and found <= {int}:
+                type_ = pa.int64()
+            elif found and found <= NUMBERS:
+                type_ = pa.float64()
+            else:
+                type_ = pa.string()
+                self.text.append(name)
+            fields.append(pa.field(name, type_))
+        self.schema = pa.schema(fields)
+        self.writer = pq.ParquetWriter(file, self.schema)
+
+    def write(self, rows: list[dict[str, Any]]):
+        for row in rows:
+            for name in self.text:
+                value = row[name]
+                if value is not None and not isinstance(value, str):
+                    row[name] = ujson.dumps(value, ensure_ascii=False)
+        self.writer.write_table(
+            self.pa.Table.from_pylist(rows, schema=self.schema)
+        )
+
+    def close(self):
+        self.writer.close()
+
+
+WRITERS: dict[str, type[Writer]] = {
+    "csv": CsvWriter,
+    "ndjson": NdjsonWriter,
+    "parquet": ParquetWriter,
+}
+
+
+async def export(
+    records: AsyncIterator[Any],
+    model: type[BaseModel],
+    target: Target,
+    format: Format = "csv",
+    columns: Sequence[str] | None = None,
+    batch: int = 1000,
+) -> int:
+    """
+    Пишет записи в target по мере прихода. В памяти одновременно не больше
+    batch строк: пачка пишется в отдельном потоке, пока следующие
+    страницы продолжают загружаться; в Parquet пачка - группа строк,
+    и для него batch стоит брать крупнее. Возвращает число строк.
+    Переданный открытый файл не закрывается.
+    """
+    writer_cls = WRITERS[format]
+    columns = list(columns or model.model_fields)
+    unknown = set(columns) - model.model_fields.keys()
+    if unknown:
+        raise ValueError(f"Нет таких полей: {', '.join(sorted(unknown))}")
+    row = serializer(model, columns)
+
+    if isinstance(target, (str, os.PathLike)):
+        if writer_cls.binary:
+            file: IO = open(target, "wb")
+        else:
+            file = open(target, "w", newline="", encoding="utf-8")
+    else:
+        file = target
+    try:
+        writer = writer_cls(file, columns, model)
+        count = 0
+        rows = []
+        async for record in records:
+            rows.append(row(record))
+            if len(rows) >= batch:
+                await asyncio.to_thread(writer.write, rows)
+                count += len(rows)
+                rows = []
+        if rows:
+            await asyncio.to_thread(writer.write, rows)
+            count += len(rows)
+        await asyncio.to_thread(writer.close)
+        return count
+    finally:
+        if file is not target:
+            file.close()
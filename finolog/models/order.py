@@ -1,12 +1,14 @@
 import datetime
-from typing import Any, NotRequired, TypedDict, Unpack
+from typing import Any, AsyncIterator, NotRequired, Sequence, Unpack
 
 from pydantic import BaseModel
+from typing_extensions import TypedDict
 
-from finolog.models.abc import BaseManager, Record
+from finolog.models.abc import PaginatedManager, Record
 from finolog.models.transaction import TransactionStatus, TransactionType
 from finolog.models.utils import Datetime, Decimal
 from finolog.models.arguments import Arguments
+from finolog.models.export import Format, Target, export
 
 from finolog.models.utils import (
     CustomBoolean,
@@ -27,23 +29,51 @@ class ItemArgs(Arguments):
         description: NotRequired[str]
         page: NotRequired[int]
         pagesize: NotRequired[int]
-        ids: NotRequired[int]
+        ids: NotRequired[EntityCollection[int] | int]
         query: NotRequired[str]
         descriptions: NotRequired[list[str]]
 
 
-class OrderManager(BaseManager["Order"]):
+class OrderManager(PaginatedManager["Order"]):
     async def get(self, id: int):
-        order = await self.api_manager.request("GET", f"/orders/order/{id}")
-        return Order(_manager=self, **order)
+        return await self.api_manager.request(
+            "GET",
+            f"/orders/order/{id}",
+            parse=lambda order: self.build(Order, order),
+        )
 
     async def get_list(
         self, **args: Unpack[ItemArgs.ArgDict]
     ) -> list["Order"]:
-        orders: list[dict[str, Any]] = await self.api_manager.request(
-            "GET", "/orders/order", ItemArgs.model_validate(args)
+        return await self.request_list(
+            Order, "/orders/order", ItemArgs.model_validate(args)
+        )
+
+    def stream(
+        self, **args: Unpack[ItemArgs.ArgDict]
+    ) -> AsyncIterator["Order"]:
+        """Как get_list, но записи разбираются и отдаются по одной"""
+        return self.stream_list(
+            Order, "/orders/order", ItemArgs.model_validate(args)
+        )
+
+    async def export(
+        self,
+        target: Target,
+        format: Format = "csv",
+        columns: Sequence[str] | None = None,
+        batch: int = 1000,
+        **args: Unpack[ItemArgs.ArgDict],
+    ) -> int:
+        """Постраничная выгрузка в файл, см. finolog.models.export"""
+        return await export(
+            self.using("lazy").iter_all(**args),
+            Order,
+            target,
+            format,
+            columns,
+            batch,
         )
-        return [Order(_manager=self, **order) for order in orders]
 
 
 class Order(Record["OrderManager"], BaseModel):
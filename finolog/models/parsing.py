@@ -0,0 +1,92 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncIterator
+
+if TYPE_CHECKING:
+    from finolog.models.abc import BaseManager, Record
+
+
+def validate(record: type["Record"], rows: list[dict[str, Any]]) -> list:
+    """Выполняется в пуле: записи возвращаются без менеджера"""
+    return [record(None, **row) for row in rows]
+
+
+class PoolParser:
+    """
+    Валидирует записи больших ответов кусками по chunk строк в пуле
+    процессов (по умолчанию) или потоков. Ответы меньше chunk строк
+    разбираются на месте. Готовые записи привязываются к менеджеру.
+    Пул строит полные модели, поэтому менеджеры отдают ему только ответы
+    в режиме model; lazy и raw строятся на месте через build.
+    """
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        chunk: int = 2000,
+        inflight: int = 4,
+    ):
+        self.executor = executor or ProcessPoolExecutor()
+        self.chunk = chunk
+        self.inflight = inflight
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+    def submit(
+        self, record: type["Record"], rows: list[dict[str, Any]]
+    ) -> asyncio.Future:
+        return asyncio.get_running_loop().run_in_executor(
+            self.executor, validate, record, rows
+        )
+
+    @staticmethod
+    def bind(manager: "BaseManager", records: list) -> list:
+        for record in records:
+            record._manager = manager
+        return records
+
+    async def parse(
+        self,
+        manager: "BaseManager",
+        record: type["Record"],
+        rows: list[dict[str, Any]],
+    ) -> list:
+        if len(rows) < self.chunk:
+            return [manager.build(record, row) for row in rows]
+        chunks = await asyncio.gather(
+            *(
+                self.submit(record, rows[start : start + self.chunk])
+                for start in range(0, len(rows), self.chunk)
+            )
+        )
+        return self.bind(manager, [item for chunk in chunks for item in chunk])
+
+    async def stream(
+        self,
+        manager: "BaseManager",
+        record: type["Record"],
+        rows: AsyncIterator[dict[str, Any]],
+    ) -> AsyncIterator[Any]:
+        """Копит строки потока в куски и держит в пуле до inflight кусков"""
+        pending: deque[asyncio.Future] = deque()
+        batch: list[dict[str, Any]] = []
+        try:
+            async for row in rows:
+                batch.append(row)
+                if len(batch) < self.chunk:
+                    continue
+                pending.append(self.submit(record, batch))
+                batch = []
+                if len(pending) >= self.inflight:
+                    for item in self.bind(manager, await pending.popleft()):
+                        yield item
+            if batch:
+                pending.append(self.submit(record, batch))
+            while pending:
+                for item in self.bind(manager, await pending.popleft()):
+                    yield item
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,44 @@
+import datetime
+from typing import Any, Iterator
+
+DAY = datetime.timedelta(days=1)
+
+
+def as_date(value: datetime.date | str) -> datetime.date:
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, str):
+        return datetime.date.fromisoformat(value[:10])
+    return value
+
+
+def day_range(
+    start: datetime.date, end: datetime.date
+) -> tuple[datetime.datetime, datetime.datetime]:
+    """Фильтр MaybeRange, покрывающий дни с start по end включительно"""
+    return (
+        datetime.datetime.combine(start, datetime.time.min),
+        datetime.datetime.combine(end, datetime.time(23, 59, 59)),
+    )
+
+
+def windows(
+    start: datetime.date, end: datetime.date, size: datetime.timedelta
+) -> Iterator[tuple[datetime.date, datetime.date]]:
+    """Делит [start, end] на непересекающиеся окна не длиннее size"""
+    size = max(size, DAY)
+    while start <= end:
+        stop = min(end, start + size - DAY)
+        yield start, stop
+        start = stop + DAY
+
+
+def split(
+    start: datetime.date, end: datetime.date
+) -> tuple[tuple[datetime.date, datetime.date], ...]:
+    middle = start + (end - start) // 2
+    return (start, middle), (middle + DAY, end)
+
+
+def field(record: Any, name: str) -> Any:
+    return record[name] if isinstance(record, dict) else getattr(record, name)
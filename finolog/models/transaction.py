@@ -1,8 +1,11 @@
+import asyncio
 import datetime
 from enum import Enum
 from typing import (
     Annotated,
     Any,
+    AsyncIterator,
+    Iterable,
     Literal,
     NotRequired,
     Sequence,
@@ -13,8 +16,11 @@ from typing import (
 from pydantic import BaseModel, Field
 from typing_extensions import TypedDict
 
-from finolog.models.abc import BaseManager, Record
+from finolog.models.abc import PaginatedManager, Record
 from finolog.models.arguments import Arguments
+from finolog.models.bulk import BulkResult, run_many
+from finolog.models.export import Format, Target, export
+from finolog.models import sharding
 from finolog.models.utils import (
     CustomBoolean,
     Datetime,
@@ -212,30 +218,62 @@ class ItemArgs(Arguments):
         is_debt: NotRequired[bool]
 
 
-class SplitArgs(BaseModel):
+class TransactionUpdateArgs(TransactionPutArgs.ArgDict, TypedDict):
     id: int
-    items: Sequence[ItemArgs]
 
 
-class TransactionManager(BaseManager["Transaction"]):
+class SplitArgs(Arguments):
+    class ArgDict(TypedDict):
+        id: int
+        items: Sequence[ItemArgs.ArgDict]
+
+
+class TransactionManager(PaginatedManager["Transaction"]):
+    bulk_concurrency: int = 8
+
     async def get(self, id: int):
-        transaction = await self.api_manager.request(
-            "GET", f"/transaction/{id}"
+        return await self.api_manager.request(
+            "GET",
+            f"/transaction/{id}",
+            parse=lambda transaction: self.build(Transaction, transaction),
         )
-        return Transaction(_manager=self, **transaction)
 
     async def get_list(
         self, **args: Unpack[TransactionGetArgs.ArgDict]
     ) -> list["Transaction"]:
-        transactions: list[dict[str, Any]] = await self.api_manager.request(
-            "GET",
+        return await self.request_list(
+            Transaction,
             "/transaction",
             TransactionGetArgs.model_validate(args),
         )
-        return [
-            Transaction(_manager=self, **transaction)
-            for transaction in transactions
-        ]
+
+    def stream(
+        self, **args: Unpack[TransactionGetArgs.ArgDict]
+    ) -> AsyncIterator["Transaction"]:
+        """Как get_list, но записи разбираются и отдаются по одной"""
+        return self.stream_list(
+            Transaction,
+            "/transaction",
+            TransactionGetArgs.model_validate(args),
+        )
+
+    async def export(
+        self,
+        target: Target,
+        format: Format = "csv",
+        columns: Sequence[str] | None = None,
+        batch: int = 1000,
+        **args: Unpack[TransactionGetArgs.ArgDict],
+    ) -> int:
+        """Постраничная выгрузка в файл, см. finolog.models.export"""
+        return await export(
+            self.using("lazy").iter_all(**args),
+            Transaction,
+            target,
+            format,
+            columns,
+            batch,
+        )
 
     @overload
     async def create(self, **args: Unpack[TransactionPostFromArgs]):
@@ -251,7 +289,9 @@ class TransactionManager(BaseManager["Transaction"]):
             "/transaction",
             TransactionPostArgs.model_validate(args),
         )
-        return Transaction(_manager=self, **response)
+        return self.written(
+            Transaction(_manager=self, **response), created=True
+        )
 
     async def update(
         self, id: int, **args: Unpack[TransactionPutArgs.ArgDict]
@@ -261,21 +301,121 @@ class TransactionManager(BaseManager["Transaction"]):
             f"/transaction/{id}",
             TransactionPutArgs.model_validate(args),
         )
-        return Transaction(_manager=self, **response)
+        return self.written(Transaction(_manager=self, **response))
 
     async def delete(self, id: int) -> dict[str, bool]:
         response = await self.api_manager.request(
             "DELETE", f"/transaction/{id}"
         )
+        self.removed(id)
         return response
 
+    async def create_many(
+        self,
+        items: Iterable[TransactionPostFromArgs | TransactionPostToArgs],
+        concurrency: int | None = None,
+    ) -> list[BulkResult["Transaction"]]:
+        return await run_many(
+            lambda args: self.create(**args),
+            items,
+            concurrency or self.bulk_concurrency,
+        )
+
+    async def update_many(
+        self,
+        items: Iterable[TransactionUpdateArgs],
+        concurrency: int | None = None,
+    ) -> list[BulkResult["Transaction"]]:
+        return await run_many(
+            lambda args: self.update(**args),
+            items,
+            concurrency or self.bulk_concurrency,
+        )
+
+    async def delete_many(
+        self, ids: Iterable[int], concurrency: int | None = None
+    ) -> list[BulkResult[dict[str, bool]]]:
+        return await run_many(
+            self.delete, ids, concurrency or self.bulk_concurrency
+        )
+
+    async def get_range(
+        self,
+        *,
+        window: datetime.timedelta = datetime.timedelta(days=31),
+        concurrency: int = 8,
+        limit: int = 500,
+        **args: Unpack[TransactionGetArgs.ArgDict],
+    ) -> list["Transaction"]:
+        """
+        Выгружает транзакции за диапазон date или report_date, деля его на
+        окна по window и запрашивая их параллельно. Окно, в котором
+        набралось limit записей, делится пополам; плотный единичный день
+        дочитывается постранично. Результат без дублей, по дате и id.
+        Одиночная дата - диапазон в один день; pagesize заменяет limit,
+        страницы get_range выбирает сам.
+        """
+        query: dict[str, Any] = dict(args)
+        name = "report_date" if "report_date" in query else "date"
+        bounds = query.pop(name, None)
+        if bounds is None:
+            raise ValueError("Для get_range нужен date или report_date")
+        if "page" in query:
+            raise ValueError("get_range выбирает страницы сам, page не нужен")
+        start, end = (
+            bounds if isinstance(bounds, (tuple, list)) else (bounds, bounds)
+        )
+        limit = query.pop("pagesize", limit)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def page(params: dict[str, Any], number: int) -> list:
+            async with semaphore:
+                return await self.get_list(
+                    **params, page=number, pagesize=limit
+                )
+
+        async def fetch(low: datetime.date, high: datetime.date) -> list:
+            params = {**query, name: sharding.day_range(low, high)}
+            records = await page(params, 1)
+            if len(records) < limit:
+                return records
+            if low == high:
+                # Плотный день: страницы по одной, каждая под семафором
+                pages = [records]
+                while len(pages[-1]) >= limit:
+                    pages.append(await page(params, len(pages) + 1))
+                return [record for chunk in pages for record in chunk]
+            halves = await asyncio.gather(
+                *(fetch(*half) for half in sharding.split(low, high))
+            )
+            return halves[0] + halves[1]
+
+        chunks = await asyncio.gather(
+            *(
+                fetch(low, high)
+                for low, high in sharding.windows(
+                    sharding.as_date(start), sharding.as_date(end), window
+                )
+            )
+        )
+        unique = {
+            sharding.field(record, "id"): record
+            for chunk in chunks
+            for record in chunk
+        }
+        return sorted(
+            unique.values(),
+            key=lambda record: (
+                str(sharding.field(record, name)),
+                sharding.field(record, "id"),
+            ),
+        )
+
     async def split(self, *args: ItemArgs.ArgDict, id: int):
         split = await self.api_manager.request(
             "POST",
             f"/transaction/{id}/split",
-            SplitArgs(
-                id=id, items=[ItemArgs.model_validate(arg) for arg in args]
-            ),
+            SplitArgs.model_validate({"id": id, "items": args}),
         )
         return split
 
@@ -318,6 +458,8 @@ class Transaction(Record[TransactionManager], BaseModel):
     original_schedule_id: int | None = None
     original_schedule: None = None
 
+    writable = frozenset(TransactionPutArgs.ArgDict.__annotations__)
+
     async def update(self, **args: Unpack[TransactionPutArgs.ArgDict]):
         return await super().update(**args)
 
@@ -1,4 +1,25 @@
+from finolog.repository.instrumentation import (
+    HistogramCollector,
+    RequestEvent,
+)
+from finolog.repository.ratelimit import RateLimiter, TokenBucket
 from finolog.repository.repository import ApiManager
+from finolog.repository.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    Hedging,
+)
+from finolog.repository.singleflight import SingleFlight
 
 
-__all__ = ("ApiManager",)
+__all__ = (
+    "ApiManager",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "Hedging",
+    "HistogramCollector",
+    "RateLimiter",
+    "RequestEvent",
+    "SingleFlight",
+    "TokenBucket",
+)
@@ -0,0 +1,149 @@
+import bisect
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint(path: str) -> str:
+    """/transaction/15/split -> /transaction/{id}/split"""
+    return ID_SEGMENT.sub("/{id}", path)
+
+
+@dataclass(slots=True)
+class RequestEvent:
+    """Замеры одного вызова ApiManager.request, время в секундах"""
+
+    method: str
+    endpoint: str
+    status: int | None = None
+    retries: int = 0
+    size: int = 0
+    network: float = 0.0
+    decode: float = 0.0
+    build: float = 0.0
+    error: Exception | None = None
+
+
+Hook = Callable[[RequestEvent], None]
+
+
+def emit(hooks: list[Hook], event: RequestEvent):
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            logger.exception("Ошибка в обработчике %r", hook)
+
+
+def geometric(start: float, stop: float, factor: float) -> list[float]:
+    bounds = []
+    while start < stop:
+        bounds.append(start)
+        start *= factor
+    return bounds
+
+
+TIME_BOUNDS = geometric(1e-5, 120.0, 1.5)
+SIZE_BOUNDS = geometric(64, 2**31, 2)
+
+
+class Histogram:
+    """Гистограмма с фиксированными границами корзин"""
+
+    def __init__(self, bounds: list[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Верхняя граница корзины, в которую попадает квантиль q"""
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], self.max)
+                return self.max
+        return 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
+@dataclass
+class EndpointStats:
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    statuses: Counter = field(default_factory=Counter)
+    network: Histogram = field(default_factory=lambda: Histogram(TIME_BOUNDS))
+    decode: Histogram = field(default_factory=lambda: Histogram(TIME_BOUNDS))
+    build: Histogram = field(default_factory=lambda: Histogram(TIME_BOUNDS))
+    size: Histogram = field(default_factory=lambda: Histogram(SIZE_BOUNDS))
+
+
+class HistogramCollector:
+    """Собирает RequestEvent в гистограммы по (метод, шаблон пути)"""
+
+    def __init__(self):
+        self.endpoints: dict[tuple[str, str], EndpointStats] = {}
+
+    def __call__(self, event: RequestEvent):
+        key = (event.method, event.endpoint)
+        stats = self.endpoints.get(key)
+        if stats is None:
+            stats = self.endpoints[key] = EndpointStats()
+        stats.requests += 1
+        stats.retries += event.retries
+        stats.statuses[event.status] += 1
+        if event.error is not None:
+            stats.errors += 1
+        stats.network.add(event.network)
+        if event.error is None:
+            stats.decode.add(event.decode)
+            stats.build.add(event.build)
+            stats.size.add(event.size)
+
+    def summary(self) -> dict[str, dict]:
+        return {
+            f"{method} {path}": {
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "retries": stats.retries,
+                "statuses": dict(stats.statuses),
+                "network": stats.network.summary(),
+                "decode": stats.decode.summary(),
+                "build": stats.build.summary(),
+                "size": stats.size.summary(),
+            }
+            for (method, path), stats in self.endpoints.items()
+        }
+
+    def reset(self):
+        self.endpoints.clear()
@@ -0,0 +1,176 @@
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from weakref import WeakKeyDictionary
+
+from httpx import AsyncClient, Response, TransportError
+
+IDEMPOTENT_METHODS = frozenset(("GET", "PUT", "DELETE"))
+RETRY_STATUSES = frozenset((500, 502, 503, 504))
+TOO_MANY_REQUESTS = 429
+
+
+class TokenBucket:
+    """
+    Ведро токенов одного API-токена. При троттлинге скорость снижается
+    вдвое, после успешных ответов постепенно возвращается к исходной.
+    """
+
+    decrease: float = 0.5
+    min_rate: float = 0.1
+
+    def __init__(self, rate: float | None = None, burst: int | None = None):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = float(burst or max(1, int(rate or 1)))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                if self.rate is None:
+                    return
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated) * self.rate,
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def throttle(self, delay: float):
+        """Сервер ответил 429: ставим паузу и снижаем скорость"""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+        if self.rate is not None:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+
+    def relax(self):
+        if self.rate is not None and self.rate < self.max_rate:  # type: ignore
+            self.rate = min(
+                self.max_rate, self.rate + self.max_rate / 20  # type: ignore
+            )
+
+
+def retry_after(response: Response) -> float | None:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        # Зона -0000 даёт дату без tzinfo; по RFC 7231 это GMT
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """
+    Ограничивает частоту запросов по API-токену и повторяет запросы,
+    упавшие на 429, 5xx или сетевой ошибке.
+
+    429 повторяется для любого метода, 5xx и сетевые ошибки - только для
+    идемпотентных. Пауза берётся из Retry-After, иначе экспоненциальная
+    со случайным разбросом; в обоих случаях не дольше max_backoff.
+
+    Вёдра заводятся на каждый цикл событий: блокировки asyncio привязаны
+    к циклу, а общий ограничитель Manager живёт дольше одного asyncio.run.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int | None = None,
+        retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.loops: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, TokenBucket]
+        ] = WeakKeyDictionary()
+
+    @property
+    def buckets(self) -> dict[str, TokenBucket]:
+        """Вёдра текущего цикла событий"""
+        loop = asyncio.get_running_loop()
+        buckets = self.loops.get(loop)
+        if buckets is None:
+            buckets = self.loops[loop] = {}
+        return buckets
+
+    def bucket(self, token: str) -> TokenBucket:
+        buckets = self.buckets
+        bucket = buckets.get(token)
+        if bucket is None:
+            bucket = buckets[token] = TokenBucket(self.rate, self.burst)
+        return bucket
+
+    async def acquire(self, session: AsyncClient):
+        """Только ожидание токена - для запросов, которые не повторяются"""
+        await self.bucket(session.headers.get("Api-Token", "")).acquire()
+
+    def delay(self, attempt: int) -> float:
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff * 2**attempt)
+        )
+
+    async def send(
+        self, session: AsyncClient, method: str, url: str, **kwargs
+    ) -> Response:
+        bucket = self.bucket(session.headers.get("Api-Token", ""))
+        idempotent = method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            await bucket.acquire()
+            try:
+                response = await session.request(method, url, **kwargs)
+            except TransportError:
+                if not idempotent or attempt >= self.retries:
+                    raise
+                await asyncio.sleep(self.delay(attempt))
+                attempt += 1
+                continue
+
+            status = response.status_code
+            if status == TOO_MANY_REQUESTS:
+                retryable = True
+            elif status in RETRY_STATUSES:
+                retryable = idempotent
+            else:
+                bucket.relax()
+                response.extensions["retries"] = attempt
+                return response
+            if not retryable or attempt >= self.retries:
+                response.extensions["retries"] = attempt
+                return response
+
+            delay = retry_after(response)
+            if delay is None:
+                delay = self.delay(attempt)
+            delay = min(delay, self.max_backoff)
+            if status == TOO_MANY_REQUESTS:
+                bucket.throttle(delay)
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
@@ -1,29 +1,213 @@
-from typing import Literal
+import asyncio
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Literal,
+    TypeVar,
+)
 
 import ujson
-from httpx import AsyncClient
+from httpx import AsyncClient, Response
 from httpx import HTTPStatusError
-from pydantic import BaseModel
+
+from finolog.repository.instrumentation import (
+    Hook,
+    RequestEvent,
+    emit,
+    endpoint,
+)
+from finolog.repository.ratelimit import RateLimiter
+from finolog.repository.resilience import CircuitBreaker, Hedging
+from finolog.repository.singleflight import SingleFlight
+from finolog.repository.streaming import JsonArrayStream
+
+if TYPE_CHECKING:
+    from finolog.models.arguments import Arguments
 
 METHOD = Literal["GET", "POST", "PUT", "DELETE"]
+QUERY_METHODS = frozenset(("GET", "DELETE"))
+
+STREAM_CHUNK = 64 * 1024
+
+T = TypeVar("T")
 
 
 class ApiManager:
-    def __init__(self, session: AsyncClient, biz_id: int):
+    def __init__(
+        self,
+        session: AsyncClient,
+        biz_id: int,
+        limiter: RateLimiter | None = None,
+        coalesce: bool = True,
+        hooks: Iterable[Hook] = (),
+        semaphore: asyncio.Semaphore | None = None,
+        hedging: Hedging | None = None,
+        breaker: CircuitBreaker | None = None,
+    ):
         self.session = session
         self.biz_id = biz_id
+        self.limiter = limiter
+        self.inflight = SingleFlight() if coalesce else None
+        self.hooks: list[Hook] = list(hooks)
+        # Общий для всех ApiManager бизнеса предел одновременных запросов
+        self.semaphore = semaphore
+        self.hedging = hedging
+        self.breaker = breaker
 
     def get_url(self, path: str):
         return f"/v1/biz/{self.biz_id}{path}"
 
     async def request(
-        self, method: METHOD, path: str, args: BaseModel | None = None
-    ):
-        json_args = (
-            ujson.loads(args.model_dump_json()) if args is not None else None
-        )
-        response = await self.session.request(
-            method, self.get_url(path), data=json_args, params=json_args
+        self,
+        method: METHOD,
+        path: str,
+        args: "Arguments | None" = None,
+        parse: Callable[[Any], T] | None = None,
+    ) -> T | Any:
+        """
+        Выполняет запрос и декодирует ответ; parse строит из него записи.
+        При подключённых hooks каждый вызов отдаёт им RequestEvent.
+        """
+        params = data = None
+        if args is not None:
+            if method in QUERY_METHODS:
+                params = args.as_params()
+            else:
+                data = args.as_params()
+        url = self.get_url(path)
+        if not self.hooks:
+            response = await self.call(method, url, data, params)
+            result = ujson.loads(response.content)
+            return parse(result) if parse is not None else result
+
+        event = RequestEvent(method, endpoint(path))
+        start = time.perf_counter()
+        try:
+            response = await self.call(method, url, data, params)
+            event.network = time.perf_counter() - start
+            event.status = response.status_code
+            event.retries = response.extensions.get("retries", 0)
+            event.size = response.num_bytes_downloaded
+
+            start = time.perf_counter()
+            result = ujson.loads(response.content)
+            event.decode = time.perf_counter() - start
+            if parse is not None:
+                start = time.perf_counter()
+                result = parse(result)
+                event.build = time.perf_counter() - start
+            return result
+        except Exception as e:
+            if not event.network:
+                event.network = time.perf_counter() - start
+            if isinstance(e, HTTPStatusError):
+                event.status = e.response.status_code
+                event.retries = e.response.extensions.get("retries", 0)
+            event.error = e
+            raise
+        finally:
+            emit(self.hooks, event)
+
+    async def stream(
+        self,
+        path: str,
+        args: "Arguments | None" = None,
+        parse: Callable[[Any], T] | None = None,
+    ) -> AsyncIterator[T | Any]:
+        """
+        GET-запрос списка, элементы которого разбираются по мере прихода
+        байтов и отдаются по одному. Ответ целиком в памяти не держится;
+        повторов, объединения запросов, хеджирования и размыкателя здесь
+        нет - поток не переиграть. Семафор бизнеса держится только до
+        заголовков ответа, так что между элементами можно обращаться к
+        другим менеджерам того же бизнеса.
+        """
+        if self.limiter is not None:
+            await self.limiter.acquire(self.session)
+        event = RequestEvent("GET", endpoint(path)) if self.hooks else None
+        semaphore = self.semaphore
+        if semaphore is not None:
+            await semaphore.acquire()
+        start = time.perf_counter()
+        try:
+            async with self.session.stream(
+                "GET",
+                self.get_url(path),
+                params=args.as_params() if args is not None else None,
+            ) as response:
+                if semaphore is not None:
+                    semaphore.release()
+                    semaphore = None
+                if event is not None:
+                    event.status = response.status_code
+                    event.network = time.perf_counter() - start
+                response.raise_for_status()
+                items = JsonArrayStream()
+                async for chunk in response.aiter_bytes(STREAM_CHUNK):
+                    for item in items.feed(chunk):
+                        yield parse(item) if parse is not None else item
+                for item in items.feed(b"", final=True):
+                    yield parse(item) if parse is not None else item
+                if event is not None:
+                    event.size = response.num_bytes_downloaded
+        except Exception as e:
+            if event is not None:
+                event.error = e
+            raise
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+            if event is not None:
+                emit(self.hooks, event)
+
+    async def call(
+        self, method: METHOD, url: str, data: Any, params: Any
+    ) -> Response:
+        if method == "GET" and self.inflight is not None:
+            # Одинаковые GET-запросы уходят один раз, тело разбирается
+            # для каждого ожидающего отдельно
+            key = (url, ujson.dumps(params, sort_keys=True))
+            return await self.inflight.do(
+                key, lambda: self.fetch(method, url, params=params)
+            )
+        return await self.fetch(method, url, data=data, params=params)
+
+    async def fetch(self, method: METHOD, url: str, **kwargs) -> Response:
+        template = endpoint(url.removeprefix(self.get_url("")))
+        if self.breaker is None:
+            return await self.checked(template, method, url, **kwargs)
+        key = None
+        if method == "GET":
+            key = (url, ujson.dumps(kwargs.get("params"), sort_keys=True))
+        return await self.breaker.call(
+            template,
+            lambda: self.checked(template, method, url, **kwargs),
+            key,
         )
+
+    async def checked(
+        self, template: str, method: METHOD, url: str, **kwargs
+    ) -> Response:
+        if self.hedging is not None and method == "GET":
+            response = await self.hedging.run(
+                template, lambda: self.send(method, url, **kwargs)
+            )
+        else:
+            response = await self.send(method, url, **kwargs)
         response.raise_for_status()
-        return response.json()
+        return response
+
+    async def send(self, method: METHOD, url: str, **kwargs) -> Response:
+        if self.semaphore is not None:
+            async with self.semaphore:
+                return await self.dispatch(method, url, **kwargs)
+        return await self.dispatch(method, url, **kwargs)
+
+    async def dispatch(self, method: METHOD, url: str, **kwargs) -> Response:
+        if self.limiter is None:
+            return await self.session.request(method, url, **kwargs)
+        return await self.limiter.send(self.session, method, url, **kwargs)
@@ -0,0 +1,233 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Hashable, Literal
+
+from httpx import HTTPStatusError, Response, TransportError
+
+from finolog.repository.instrumentation import TIME_BOUNDS, Histogram
+
+Call = Callable[[], Awaitable[Response]]
+
+
+@dataclass
+class HedgeStats:
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    latency: Histogram = field(default_factory=lambda: Histogram(TIME_BOUNDS))
+
+    @property
+    def rate(self) -> float:
+        return self.hedged / self.requests if self.requests else 0.0
+
+
+def settled(task: "asyncio.Task[Response]") -> bool:
+    """Ответ попытки можно отдавать: не ошибка, не 429 и не 5xx"""
+    if task.exception() is not None:
+        return False
+    status = task.result().status_code
+    return status < 500 and status != 429
+
+
+class Hedging:
+    """
+    Дублирует GET, если ответа нет дольше quantile задержек этого
+    шаблона пути; берётся первый успешный ответ, второй запрос
+    отменяется. Неудачная попытка ждёт оставшуюся, а если неудачны
+    обе, отдаётся исход исходного запроса. Пока замеров меньше
+    min_samples, порог - delay.
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        delay: float = 1.0,
+        min_delay: float = 0.05,
+        max_delay: float = 5.0,
+        min_samples: int = 20,
+    ):
+        self.quantile = quantile
+        self.delay = delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.endpoints: dict[str, HedgeStats] = {}
+
+    def stats(self, endpoint: str) -> HedgeStats:
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = HedgeStats()
+        return stats
+
+    def threshold(self, stats: HedgeStats) -> float:
+        if stats.latency.count < self.min_samples:
+            return self.delay
+        return min(
+            self.max_delay,
+            max(self.min_delay, stats.latency.quantile(self.quantile)),
+        )
+
+    async def run(self, endpoint: str, call: Call) -> Response:
+        stats = self.stats(endpoint)
+        stats.requests += 1
+        start = time.perf_counter()
+        first = asyncio.ensure_future(call())
+        tasks = {first}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.threshold(stats))
+            if not done:
+                stats.hedged += 1
+                tasks.add(asyncio.ensure_future(call()))
+            while True:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if settled(task):
+                        if task is not first:
+                            stats.hedge_wins += 1
+                        stats.latency.add(time.perf_counter() - start)
+                        return task.result()
+                if not tasks:
+                    # Неудачны все попытки: отдаём исход исходного запроса
+                    return first.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def summary(self) -> dict[str, dict]:
+        return {
+            endpoint: {
+                "requests": stats.requests,
+                "hedged": stats.hedged,
+                "hedge_wins": stats.hedge_wins,
+                "rate": stats.rate,
+                "threshold": self.threshold(stats),
+            }
+            for endpoint, stats in self.endpoints.items()
+        }
+
+
+class CircuitOpenError(Exception):
+    """Запросы к шаблону пути временно не отправляются"""
+
+    def __init__(self, endpoint: str):
+        super().__init__(f"API недоступно: {endpoint}")
+        self.endpoint = endpoint
+
+
+State = Literal["closed", "open", "half-open"]
+
+
+@dataclass
+class Circuit:
+    state: State = "closed"
+    failures: int = 0
+    opened_at: float = 0.0
+    trips: int = 0
+    rejected: int = 0
+    stale: int = 0
+
+
+def is_failure(error: BaseException) -> bool:
+    """Сбоем API считаются сетевые ошибки и 5xx, но не 4xx"""
+    if isinstance(error, HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, TransportError)
+
+
+class CircuitBreaker:
+    """
+    Размыкатель по шаблону пути: после failures сбоев подряд запросы
+    reset секунд не отправляются, затем один пробный решает, замкнуть
+    ли цепь. Пока цепь разомкнута - CircuitOpenError. С stale > 0 GET
+    отдаётся из последних stale удачных ответов, если такой был; ответы
+    хранятся целиком, так что для больших списков запас стоит держать
+    небольшим.
+    """
+
+    def __init__(
+        self, failures: int = 5, reset: float = 30.0, stale: int = 0
+    ):
+        self.failures = failures
+        self.reset = reset
+        self.stale = stale
+        self.circuits: dict[str, Circuit] = {}
+        self.responses: OrderedDict[Hashable, Response] = OrderedDict()
+
+    def circuit(self, endpoint: str) -> Circuit:
+        circuit = self.circuits.get(endpoint)
+        if circuit is None:
+            circuit = self.circuits[endpoint] = Circuit()
+        return circuit
+
+    def allow(self, circuit: Circuit) -> bool:
+        if circuit.state == "closed":
+            return True
+        if (
+            circuit.state == "open"
+            and time.monotonic() - circuit.opened_at >= self.reset
+        ):
+            circuit.state = "half-open"
+            return True
+        return False
+
+    def open(self, circuit: Circuit):
+        circuit.state = "open"
+        circuit.opened_at = time.monotonic()
+        circuit.trips += 1
+
+    async def call(
+        self, endpoint: str, call: Call, key: Hashable | None = None
+    ) -> Response:
+        """key - ключ GET-запроса для ответа из запаса"""
+        circuit = self.circuit(endpoint)
+        if not self.allow(circuit):
+            circuit.rejected += 1
+            response = self.responses.get(key) if key is not None else None
+            if response is None:
+                raise CircuitOpenError(endpoint)
+            circuit.stale += 1
+            return response
+
+        probe = circuit.state == "half-open"
+        try:
+            response = await call()
+        except Exception as e:
+            if is_failure(e):
+                circuit.failures += 1
+                if probe or circuit.failures >= self.failures:
+                    self.open(circuit)
+            else:
+                circuit.state = "closed"
+                circuit.failures = 0
+            raise
+        except BaseException:
+            # Запрос отменён и ничего не говорит об API; пробный
+            # возвращает цепь в open - решит следующий
+            if probe:
+                circuit.state = "open"
+            raise
+        circuit.state = "closed"
+        circuit.failures = 0
+        if key is not None and self.stale:
+            self.responses[key] = response
+            self.responses.move_to_end(key)
+            while len(self.responses) > self.stale:
+                self.responses.popitem(last=False)
+        return response
+
+    def summary(self) -> dict[str, dict]:
+        return {
+            endpoint: {
+                "state": circuit.state,
+                "failures": circuit.failures,
+                "trips": circuit.trips,
+                "rejected": circuit.rejected,
+                "stale": circuit.stale,
+            }
+            for endpoint, circuit in self.circuits.items()
+        }
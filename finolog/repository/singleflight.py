@@ -0,0 +1,20 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Объединяет одинаковые запросы, выполняющиеся одновременно"""
+
+    def __init__(self):
+        self.calls: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        future = self.calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self.calls[key] = future
+            future.add_done_callback(lambda _: self.calls.pop(key, None))
+        # Отмена одного ожидающего не должна отменять запрос остальным
+        return await asyncio.shield(future)
@@ -0,0 +1,101 @@
+import codecs
+import json
+import re
+from typing import Any
+
+WHITESPACE = re.compile(r"\s*")
+
+
+def skip(pattern: re.Pattern[str], text: str, pos: int) -> int:
+    """Позиция после совпадения pattern, начиная с pos"""
+    match = pattern.match(text, pos)
+    return pos if match is None else match.end()
+
+
+class JsonArrayStream:
+    """
+    Инкрементально выделяет элементы JSON-массива верхнего уровня из
+    потока байтов. В памяти держится только недочитанный хвост. Между
+    элементами - ровно одна запятая, после "]" - только пробелы;
+    остальное - ValueError, как у json.loads.
+    """
+
+    decoder = json.JSONDecoder()
+
+    def __init__(self):
+        self.text = ""
+        self.chars = codecs.getincrementaldecoder("utf-8")()
+        self.opened = False
+        self.closed = False
+        # Следующий ожидаемый токен: "first" - элемент или "]" сразу
+        # после "[", "item" - элемент после запятой, "separator" - ","
+        # или "]" после элемента
+        self.expect = "first"
+
+    def feed(self, chunk: bytes, final: bool = False) -> list[Any]:
+        text = self.text + self.chars.decode(chunk, final)
+        items: list[Any] = []
+        pos = 0
+        if self.closed:
+            return self.trailing(text, pos)
+        if not self.opened:
+            pos = len(text) - len(text.lstrip())
+            if pos == len(text):
+                self.text = ""
+                return items
+            if text[pos] != "[":
+                raise ValueError("Ожидался JSON-массив")
+            self.opened = True
+            pos += 1
+        while not self.closed:
+            pos = skip(WHITESPACE, text, pos)
+            if pos == len(text):
+                break
+            char = text[pos]
+            if self.expect == "separator":
+                if char == ",":
+                    self.expect = "item"
+                elif char == "]":
+                    self.closed = True
+                else:
+                    raise ValueError(f"Ожидались ',' или ']' на {pos}")
+                pos += 1
+                continue
+            if char == "]":
+                if self.expect != "first":
+                    raise ValueError("Лишняя запятая перед ']'")
+                self.closed = True
+                pos += 1
+                break
+            if char == ",":
+                raise ValueError(f"Лишняя запятая на {pos}")
+            try:
+                item, end = self.decoder.raw_decode(text, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break
+            # Число, обрезанное концом куска, может продолжиться в следующем
+            if not final and not isinstance(item, (dict, list, str)):
+                after = skip(WHITESPACE, text, end)
+                if after == len(text) or (
+                    after == end and text[after] not in ",]"
+                ):
+                    break
+            items.append(item)
+            self.expect = "separator"
+            pos = end
+        if self.closed:
+            self.trailing(text, pos)
+            return items
+        self.text = text[pos:]
+        if final:
+            raise ValueError("JSON-массив оборвался")
+        return items
+
+    def trailing(self, text: str, pos: int) -> list[Any]:
+        """После закрывающей скобки допустимы только пробелы"""
+        if skip(WHITESPACE, text, pos) != len(text):
+            raise ValueError("Данные после конца JSON-массива")
+        self.text = ""
+        return []
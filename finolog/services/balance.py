@@ -0,0 +1,137 @@
+import datetime
+from decimal import Decimal
+from typing import NamedTuple
+
+from finolog.models.abc import Subscriber
+from finolog.models.transaction import (
+    Transaction,
+    TransactionManager,
+    TransactionStatus,
+    TransactionType,
+)
+
+ZERO = Decimal(0)
+
+
+class DayTree:
+    """
+    Дерево Фенвика по дням: прибавление к дню и сумма на конец дня
+    за O(log n). Диапазон дней расширяется перестройкой.
+    """
+
+    def __init__(self, day: int, size: int = 1024):
+        self.origin = day - size // 2
+        self.days: dict[int, Decimal] = {}
+        self.tree = [ZERO] * (size + 1)
+
+    def add(self, day: int, amount: Decimal):
+        self.days[day] = self.days.get(day, ZERO) + amount
+        index = day - self.origin + 1
+        if index < 1 or index >= len(self.tree):
+            return self.rebuild(day)
+        while index < len(self.tree):
+            self.tree[index] += amount
+            index += index & -index
+
+    def rebuild(self, day: int):
+        low = min(min(self.days), day)
+        high = max(max(self.days), day)
+        size = len(self.tree) - 1
+        while size < (high - low + 1) * 2:
+            size *= 2
+        self.origin = low - (size - (high - low + 1)) // 2
+        self.tree = [ZERO] * (size + 1)
+        days, self.days = self.days, {}
+        for day, amount in days.items():
+            self.add(day, amount)
+
+    def total(self, day: int) -> Decimal:
+        """Сумма по всем дням до day включительно"""
+        index = min(day - self.origin + 1, len(self.tree) - 1)
+        total = ZERO
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+
+class Entry(NamedTuple):
+    account_id: int
+    status: TransactionStatus
+    day: int
+    value: Decimal
+    base_value: Decimal
+
+
+def amount(value, type: TransactionType) -> Decimal:
+    value = abs(Decimal(str(value)))
+    return value if type == TransactionType.IN else -value
+
+
+class BalanceIndex(Subscriber):
+    """
+    Остатки по счетам на любую дату из потока транзакций, отдельно по
+    статусам. Приход считается с плюсом, расход - с минусом; начальный
+    остаток счёта не учитывается. Подключённый к TransactionManager
+    индекс обновляется при create/update/delete.
+    """
+
+    def __init__(self):
+        self.trees: dict[tuple[int, TransactionStatus, str], DayTree] = {}
+        self.entries: dict[int, Entry] = {}
+
+    async def load(self, manager: TransactionManager, **args):
+        async for transaction in manager.using("lazy").iter_all(**args):
+            self.add(transaction)
+
+    def apply(self, entry: Entry, sign: int):
+        for column in ("value", "base_value"):
+            key = (entry.account_id, entry.status, column)
+            tree = self.trees.get(key)
+            if tree is None:
+                tree = self.trees[key] = DayTree(entry.day)
+            tree.add(entry.day, getattr(entry, column) * sign)
+
+    def add(self, transaction: Transaction):
+        self.remove(transaction.id)
+        if transaction.deleted_at is not None:
+            return
+        entry = Entry(
+            transaction.account_id,
+            TransactionStatus(transaction.status),
+            transaction.date.toordinal(),
+            amount(transaction.value, transaction.type),
+            amount(transaction.base_value, transaction.type),
+        )
+        self.entries[transaction.id] = entry
+        self.apply(entry, 1)
+
+    def remove(self, id: int):
+        entry = self.entries.pop(id, None)
+        if entry is not None:
+            self.apply(entry, -1)
+
+    def balance(
+        self,
+        account_id: int,
+        date: datetime.date,
+        status: TransactionStatus = TransactionStatus.REGULAR,
+        column: str = "value",
+    ) -> Decimal:
+        """Остаток счёта на конец дня date"""
+        tree = self.trees.get((account_id, status, column))
+        return tree.total(date.toordinal()) if tree else ZERO
+
+    def turnover(
+        self,
+        account_id: int,
+        start: datetime.date,
+        end: datetime.date,
+        status: TransactionStatus = TransactionStatus.REGULAR,
+        column: str = "value",
+    ) -> Decimal:
+        """Изменение остатка за дни с start по end включительно"""
+        before = start - datetime.timedelta(days=1)
+        return self.balance(account_id, end, status, column) - self.balance(
+            account_id, before, status, column
+        )
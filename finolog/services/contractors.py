@@ -0,0 +1,178 @@
+import asyncio
+import re
+from collections import Counter
+from functools import partial
+from typing import Iterable
+
+from finolog.models.abc import Subscriber
+from finolog.models.contractor import Contractor, ContractorManager
+
+LEGAL_FORMS = frozenset(
+    (
+        "ооо",
+        "оао",
+        "зао",
+        "пао",
+        "ао",
+        "ип",
+        "нко",
+        "ано",
+        "llc",
+        "ltd",
+        "inc",
+    )
+)
+PUNCTUATION = re.compile(r"[^\w\s]+")
+SPACES = re.compile(r"\s+")
+
+
+def normalize(name: str) -> str:
+    """'ООО «Ромашка»' -> 'ромашка': регистр, ё, кавычки, ОПФ, пробелы"""
+    name = PUNCTUATION.sub(" ", name.casefold().replace("ё", "е"))
+    words = [word for word in name.split() if word not in LEGAL_FORMS]
+    return " ".join(words) if words else SPACES.sub(" ", name).strip()
+
+
+def trigrams(normalized: str) -> set[str]:
+    padded = f"  {normalized} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class ContractorIndex(Subscriber):
+    """
+    Контрагенты по нормализованному имени с нечётким поиском по
+    триграммам. get_or_create_many сопоставляет пачку имён с индексом
+    и создаёт только отсутствующих - по одному запросу на имя, даже
+    если одно имя ищут несколько задач сразу. Подключённый к
+    ContractorManager индекс видит созданных через него контрагентов.
+    """
+
+    concurrency: int = 4
+
+    def __init__(self):
+        self.contractors: dict[int, Contractor] = {}
+        self.names: dict[str, int] = {}
+        self.same: dict[str, set[int]] = {}
+        self.grams: dict[str, set[int]] = {}
+        self.keys: dict[int, str] = {}
+        self.creating: dict[str, asyncio.Task] = {}
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+
+    def __len__(self) -> int:
+        return len(self.contractors)
+
+    async def load(self, manager: ContractorManager, **args):
+        async for contractor in manager.iter_all(**args):
+            self.add(contractor)
+
+    def add(self, contractor: Contractor):
+        self.remove(contractor.id)
+        key = normalize(contractor.name)
+        self.contractors[contractor.id] = contractor
+        self.keys[contractor.id] = key
+        self.same.setdefault(key, set()).add(contractor.id)
+        # При совпадении имён побеждает контрагент с меньшим id
+        if self.names.get(key, contractor.id) >= contractor.id:
+            self.names[key] = contractor.id
+        for gram in trigrams(key):
+            self.grams.setdefault(gram, set()).add(contractor.id)
+
+    def remove(self, id: int):
+        if self.contractors.pop(id, None) is None:
+            return
+        key = self.keys.pop(id)
+        same = self.same[key]
+        same.discard(id)
+        if not same:
+            del self.same[key]
+            del self.names[key]
+        elif self.names[key] == id:
+            self.names[key] = min(same)
+        for gram in trigrams(key):
+            ids = self.grams[gram]
+            ids.discard(id)
+            if not ids:
+                del self.grams[gram]
+
+    def find(self, name: str) -> Contractor | None:
+        id = self.names.get(normalize(name))
+        return None if id is None else self.contractors[id]
+
+    def search(
+        self, name: str, limit: int = 5, threshold: float = 0.3
+    ) -> list[tuple[Contractor, float]]:
+        """Похожие по триграммам (коэффициент Жаккара), лучшие первыми"""
+        grams = trigrams(normalize(name))
+        shared: Counter[int] = Counter()
+        for gram in grams:
+            shared.update(self.grams.get(gram, ()))
+        scored = []
+        for id, common in shared.items():
+            other = len(trigrams(self.keys[id]))
+            score = common / (len(grams) + other - common)
+            if score >= threshold:
+                scored.append((score, -id))
+        scored.sort(reverse=True)
+        return [(self.contractors[-id], score) for score, id in scored[:limit]]
+
+    def match(
+        self, name: str, threshold: float | None = None
+    ) -> Contractor | None:
+        """Точное совпадение имени, иначе лучшее нечёткое от threshold"""
+        found = self.find(name)
+        if found is None and threshold is not None:
+            best = self.search(name, limit=1, threshold=threshold)
+            found = best[0][0] if best else None
+        return found
+
+    def created(self, key: str, task: asyncio.Task):
+        self.creating.pop(key, None)
+
+    async def get_or_create_many(
+        self,
+        manager: ContractorManager,
+        names: Iterable[str],
+        threshold: float | None = None,
+    ) -> list[Contractor]:
+        """
+        Контрагент для каждого имени в порядке names. threshold включает
+        нечёткое сопоставление; без него совпадать должны нормализованные
+        имена. Если какое-то имя создать не удалось, остальные создания
+        всё равно доводятся до конца и попадают в индекс, а ошибки
+        поднимаются одним ExceptionGroup.
+        """
+
+        async def create(name: str) -> Contractor:
+            async with self.semaphore:
+                contractor = await manager.create(name)
+            self.add(contractor)
+            return contractor
+
+        results: list[Contractor | asyncio.Task] = []
+        for name in names:
+            found = self.match(name, threshold)
+            if found is not None:
+                results.append(found)
+                continue
+            key = normalize(name)
+            task = self.creating.get(key)
+            if task is None:
+                task = self.creating[key] = asyncio.create_task(create(name))
+                task.add_done_callback(partial(self.created, key))
+            results.append(task)
+        tasks = list(
+            dict.fromkeys(
+                task for task in results if isinstance(task, asyncio.Task)
+            )
+        )
+        if tasks:
+            await asyncio.wait(tasks)
+        errors = [
+            e for task in tasks if isinstance(e := task.exception(), Exception)
+        ]
+        if errors:
+            raise ExceptionGroup("Не все контрагенты созданы", errors)
+        return [
+            task.result() if isinstance(task, asyncio.Task) else task
+            for task in results
+        ]
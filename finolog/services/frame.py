@@ -0,0 +1,150 @@
+from typing import Any, Iterable, Self
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "Для TransactionFrame нужен numpy: "
+        "pip install finolog-api-wrapper[analytics]"
+    ) from e
+
+from finolog.models.abc import PaginatedManager
+from finolog.models.transaction import TransactionManager
+
+ID_COLUMNS = (
+    "id",
+    "account_id",
+    "category_id",
+    "contractor_id",
+    "project_id",
+    "order_id",
+    "requisite_id",
+)
+VALUE_COLUMNS = ("value", "base_value")
+DATE_COLUMNS = ("date", "report_date")
+LABEL_COLUMNS = ("type", "status")
+SET_COLUMNS = ID_COLUMNS + LABEL_COLUMNS
+
+
+def to_day(value: Any) -> np.datetime64:
+    return np.datetime64(str(value)[:10], "D")
+
+
+class TransactionFrame:
+    """
+    Колоночное представление транзакций на массивах numpy.
+    Отсутствующие id хранятся как 0, суммы - как float64.
+    """
+
+    def __init__(self, columns: dict[str, np.ndarray]):
+        self.columns = columns
+
+    @classmethod
+    def from_json(cls, rows: Iterable[dict[str, Any]]) -> Self:
+        """Строит фрейм из ответа /transaction без создания моделей"""
+        rows = rows if isinstance(rows, list) else list(rows)
+        count = len(rows)
+        columns: dict[str, np.ndarray] = {}
+        for name in ID_COLUMNS:
+            columns[name] = np.fromiter(
+                (row.get(name) or 0 for row in rows), np.int64, count
+            )
+        for name in VALUE_COLUMNS:
+            columns[name] = np.fromiter(
+                (float(row[name]) for row in rows), np.float64, count
+            )
+        for name in DATE_COLUMNS:
+            columns[name] = np.array(
+                [row[name][:10] for row in rows], dtype="datetime64[D]"
+            )
+        for name in LABEL_COLUMNS:
+            columns[name] = np.array([row[name] for row in rows], dtype="U8")
+        return cls(columns)
+
+    @classmethod
+    def concat(cls, frames: Iterable["TransactionFrame"]) -> Self:
+        frames = list(frames)
+        if not frames:
+            return cls.from_json([])
+        return cls(
+            {
+                name: np.concatenate([frame.columns[name] for frame in frames])
+                for name in frames[0].columns
+            }
+        )
+
+    @classmethod
+    async def fetch(
+        cls, manager: TransactionManager, chunk: int = 10_000, **args
+    ) -> Self:
+        """
+        Выгружает все страницы и складывает их во фрейм кусками по chunk
+        строк, не держа в памяти весь ответ целиком
+        """
+        frames: list[TransactionFrame] = []
+        rows: list[dict[str, Any]] = []
+        # В режиме raw iter_all отдаёт словари, а не Transaction
+        raw: PaginatedManager[Any] = manager.using("raw")
+        async for row in raw.iter_all(**args):
+            rows.append(row)
+            if len(rows) >= chunk:
+                frames.append(cls.from_json(rows))
+                rows = []
+        frames.append(cls.from_json(rows))
+        return cls.concat(frames)
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def filter(self, mask: np.ndarray) -> Self:
+        return type(self)(
+            {name: column[mask] for name, column in self.columns.items()}
+        )
+
+    def mask(self, **conditions: Any) -> np.ndarray:
+        """
+        Маска по условиям: для дат и сумм кортеж - это диапазон
+        (включительно), список или множество - набор значений, для id
+        и меток набор значений - любая коллекция, иначе сравнение на
+        равенство
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for name, condition in conditions.items():
+            column = self.columns[name]
+            if name in DATE_COLUMNS:
+                condition = (
+                    type(condition)(map(to_day, condition))
+                    if isinstance(condition, (tuple, list, set, frozenset))
+                    else to_day(condition)
+                )
+            if isinstance(condition, tuple) and name not in SET_COLUMNS:
+                low, high = condition
+                mask &= (column >= low) & (column <= high)
+            elif isinstance(condition, (tuple, list, set, frozenset)):
+                mask &= np.isin(column, list(condition))
+            else:
+                mask &= column == condition
+        return mask
+
+    def where(self, **conditions: Any) -> Self:
+        return self.filter(self.mask(**conditions))
+
+    def group_sum(
+        self, by: str, column: str = "value"
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Сумма column по уникальным значениям by: (ключи, суммы)"""
+        keys, inverse = np.unique(self.columns[by], return_inverse=True)
+        sums = np.bincount(
+            inverse.ravel(), weights=self.columns[column], minlength=len(keys)
+        )
+        return keys, sums
+
+    def cumsum(
+        self, column: str = "value", by: str = "date"
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Нарастающий итог column по дням: (даты, итог на конец дня)"""
+        keys, sums = self.group_sum(by, column)
+        return keys, np.cumsum(sums)
@@ -0,0 +1,163 @@
+import asyncio
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    Mapping,
+    TypeVar,
+)
+
+from httpx import HTTPStatusError
+
+from finolog.models.bulk import run_many
+from finolog.models.transaction import Transaction
+from finolog.services.manager import Manager
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+NOT_FOUND = 404
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Копит ключи, запрошенные за один проход цикла событий, и загружает
+    их одним вызовом batch (не больше max_batch ключей за раз). Каждый
+    ключ загружается один раз за жизнь загрузчика; отсутствующие дают
+    None. Загрузчик рассчитан на одну область - запрос, отчёт, задачу.
+    """
+
+    def __init__(
+        self,
+        batch: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+        max_batch: int = 100,
+    ):
+        self.batch = batch
+        self.max_batch = max_batch
+        self.futures: dict[K, asyncio.Future] = {}
+        self.queue: list[K] = []
+        self.tasks: set[asyncio.Task] = set()
+
+    def load(self, key: K) -> "asyncio.Future[V | None]":
+        future = self.futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self.futures[key] = loop.create_future()
+            if not self.queue:
+                loop.call_soon(self.dispatch)
+            self.queue.append(key)
+        # Отмена одного ожидающего не должна отменять ключ для остальных
+        return asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        return await asyncio.gather(*map(self.load, keys))
+
+    def dispatch(self):
+        keys, self.queue = self.queue, []
+        for start in range(0, len(keys), self.max_batch):
+            task = asyncio.create_task(
+                self.run(keys[start : start + self.max_batch])
+            )
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def run(self, keys: list[K]):
+        try:
+            found = await self.batch(keys)
+        except BaseException as e:
+            for key in keys:
+                # Ошибка не запоминается: следующий load повторит запрос
+                future = self.futures.pop(key)
+                if future.done():
+                    continue
+                if isinstance(e, Exception):
+                    future.set_exception(e)
+                else:
+                    future.cancel()
+            if not isinstance(e, Exception):
+                raise
+            return
+        for key in keys:
+            future = self.futures[key]
+            if future.done():
+                del self.futures[key]
+            else:
+                future.set_result(found.get(key))
+
+
+@dataclass(slots=True)
+class Related:
+    transaction: Transaction
+    account: Any = None
+    contractor: Any = None
+    order: Any = None
+
+
+class TransactionRelations:
+    """
+    Связанные записи транзакций пачками: счета - одним списком счетов,
+    заказы - фильтром ids, контрагенты - параллельными get (у API нет
+    фильтра по id). Статьи и проекты остаются id - менеджеров для них
+    в клиенте нет.
+
+    relations = TransactionRelations(manager)
+    rows = await relations.resolve(transactions)
+    """
+
+    concurrency: int = 8
+
+    def __init__(self, manager: Manager, concurrency: int | None = None):
+        self.manager = manager
+        if concurrency is not None:
+            self.concurrency = concurrency
+        self.accounts: DataLoader[int, Any] = DataLoader(self.load_accounts)
+        self.contractors: DataLoader[int, Any] = DataLoader(
+            self.load_contractors
+        )
+        self.orders: DataLoader[int, Any] = DataLoader(self.load_orders)
+
+    async def load_accounts(self, ids: list[int]) -> dict[int, Any]:
+        accounts = await self.manager.accounts.get_list()
+        return {account.id: account for account in accounts}
+
+    async def load_orders(self, ids: list[int]) -> dict[int, Any]:
+        orders = await self.manager.orders.get_list(
+            ids=tuple(ids), pagesize=len(ids)
+        )
+        return {order.id: order for order in orders}
+
+    async def load_contractors(self, ids: list[int]) -> dict[int, Any]:
+        results = await run_many(
+            self.manager.contractors.get, ids, self.concurrency
+        )
+        found = {}
+        for result in results:
+            if result.ok:
+                found[result.args] = result.result
+            elif not (
+                isinstance(result.error, HTTPStatusError)
+                and result.error.response.status_code == NOT_FOUND
+            ):
+                raise result.error  # type: ignore[misc]
+        return found
+
+    async def related(self, transaction: Transaction) -> Related:
+        account, contractor, order = await asyncio.gather(
+            self.accounts.load(transaction.account_id),
+            self.optional(self.contractors, transaction.contractor_id),
+            self.optional(self.orders, transaction.order_id),
+        )
+        return Related(transaction, account, contractor, order)
+
+    @staticmethod
+    async def optional(loader: DataLoader, id: int | None) -> Any:
+        return None if id is None else await loader.load(id)
+
+    async def resolve(
+        self, transactions: Iterable[Transaction]
+    ) -> list[Related]:
+        return await asyncio.gather(*map(self.related, transactions))
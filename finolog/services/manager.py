@@ -1,31 +1,92 @@
-import httpx
+import asyncio
+from functools import cached_property
+from typing import TYPE_CHECKING
 
-from finolog.models.account import AccountManager
-from finolog.models.company import CompanyManager
-from finolog.models.order import OrderManager
-from finolog.models.transaction import TransactionManager
-from finolog.models.contractor import ContractorManager
+import httpx
 
+from finolog.repository.ratelimit import RateLimiter
 from finolog.repository.repository import ApiManager
 
+if TYPE_CHECKING:
+    from finolog.models.account import AccountManager
+    from finolog.models.company import CompanyManager
+    from finolog.models.contractor import ContractorManager
+    from finolog.models.order import OrderManager
+    from finolog.models.transaction import TransactionManager
+
 # from finolog.services.utils import serialise_pydantic
 
 
 class Manager:
     session: httpx.AsyncClient | None = None
+    rate_limiter: RateLimiter | None = RateLimiter()
 
-    def __init__(self, biz_id: int, api_token: str | None = None):
-        if not self.session and api_token is None:
+    def __init__(
+        self,
+        biz_id: int,
+        api_token: str | None = None,
+        cache: bool = False,
+        session: httpx.AsyncClient | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+    ):
+        """
+        session - клиент этого менеджера вместо общего классового,
+        semaphore - предел одновременных запросов бизнеса (см. ClientPool)
+        """
+        session = session or self.session
+        if not session and api_token is None:
             raise ValueError(
                 "Или укажите токен, или инициализируйте сессию отдельно"
             )
-        session = self.session or self.init_session(api_token)  # type: ignore
-        self.manager = ApiManager(session, biz_id=biz_id)
-        self.transactions = TransactionManager(api_manager=self.manager)
-        self.companies = CompanyManager(api_manager=self.manager)
-        self.accounts = AccountManager(api_manager=self.manager)
-        self.orders = OrderManager(api_manager=self.manager)
-        self.contractors = ContractorManager(api_manager=self.manager)
+        session = session or self.init_session(api_token)  # type: ignore
+        self.manager = ApiManager(
+            session,
+            biz_id=biz_id,
+            limiter=self.rate_limiter,
+            semaphore=semaphore,
+        )
+        self.cache = cache
+
+    # Модули моделей импортируются при первом обращении к менеджеру
+
+    @cached_property
+    def transactions(self) -> "TransactionManager":
+        from finolog.models.transaction import TransactionManager
+
+        return TransactionManager(api_manager=self.manager)
+
+    @cached_property
+    def companies(self) -> "CompanyManager":
+        from finolog.models.company import CompanyManager
+
+        return CompanyManager(
+            api_manager=self.manager,
+            cache=CompanyManager.make_cache() if self.cache else None,
+        )
+
+    @cached_property
+    def accounts(self) -> "AccountManager":
+        from finolog.models.account import AccountManager
+
+        return AccountManager(
+            api_manager=self.manager,
+            cache=AccountManager.make_cache() if self.cache else None,
+        )
+
+    @cached_property
+    def orders(self) -> "OrderManager":
+        from finolog.models.order import OrderManager
+
+        return OrderManager(api_manager=self.manager)
+
+    @cached_property
+    def contractors(self) -> "ContractorManager":
+        from finolog.models.contractor import ContractorManager
+
+        return ContractorManager(
+            api_manager=self.manager,
+            cache=ContractorManager.make_cache() if self.cache else None,
+        )
 
     @classmethod
     def init_session(cls, api_token: str):
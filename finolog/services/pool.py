@@ -0,0 +1,120 @@
+import asyncio
+import importlib.util
+from typing import Awaitable, Callable, Iterable, Mapping, TypeVar
+
+import httpx
+
+from finolog.models.bulk import BulkResult, run_many
+from finolog.services.manager import Manager
+
+T = TypeVar("T")
+
+BASE_URL = "https://api.finolog.ru/"
+
+
+class ClientPool:
+    """
+    Клиенты httpx по API-токену и менеджеры по бизнесу для обслуживания
+    многих бизнесов сразу. Бизнесы с одним токеном делят клиент и его
+    keep-alive соединения; HTTP/2 включается, если установлен h2.
+    Одновременные запросы ограничены на клиент (max_connections) и на
+    бизнес (tenant_concurrency); частоту по токену держит общий
+    RateLimiter Manager.
+
+    pool = ClientPool()
+    results = await pool.fan_out(
+        tenants, lambda manager: manager.transactions.get_list(**args)
+    )
+    """
+
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        http2: bool | None = None,
+        max_connections: int = 20,
+        max_keepalive: int = 20,
+        keepalive_expiry: float = 60.0,
+        timeout: float = 30.0,
+        tenant_concurrency: int = 4,
+        concurrency: int = 64,
+        cache: bool = False,
+    ):
+        if http2 is None:
+            http2 = importlib.util.find_spec("h2") is not None
+        self.base_url = base_url
+        self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(timeout)
+        self.tenant_concurrency = tenant_concurrency
+        self.concurrency = concurrency
+        self.cache = cache
+        self.clients: dict[str, httpx.AsyncClient] = {}
+        self.semaphores: dict[int, asyncio.Semaphore] = {}
+        self.managers: dict[int, tuple[str, Manager]] = {}
+
+    def client(self, api_token: str) -> httpx.AsyncClient:
+        client = self.clients.get(api_token)
+        if client is None:
+            client = self.clients[api_token] = self.make_client(api_token)
+        return client
+
+    def make_client(self, api_token: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"Api-Token": api_token},
+            http2=self.http2,
+            limits=self.limits,
+            timeout=self.timeout,
+        )
+
+    def manager(self, biz_id: int, api_token: str) -> Manager:
+        entry = self.managers.get(biz_id)
+        if entry is not None and entry[0] == api_token:
+            return entry[1]
+        semaphore = self.semaphores.get(biz_id)
+        if semaphore is None:
+            semaphore = self.semaphores[biz_id] = asyncio.Semaphore(
+                self.tenant_concurrency
+            )
+        manager = Manager(
+            biz_id,
+            cache=self.cache,
+            session=self.client(api_token),
+            semaphore=semaphore,
+        )
+        self.managers[biz_id] = (api_token, manager)
+        return manager
+
+    async def fan_out(
+        self,
+        tenants: Mapping[int, str] | Iterable[tuple[int, str]],
+        call: Callable[[Manager], Awaitable[T]],
+        concurrency: int | None = None,
+    ) -> dict[int, BulkResult[T]]:
+        """
+        Выполняет call для менеджера каждого бизнеса (biz_id -> токен),
+        не больше concurrency бизнесов сразу. Ошибка одного бизнеса не
+        мешает остальным.
+        """
+        if isinstance(tenants, Mapping):
+            tenants = tenants.items()
+        managers = [
+            self.manager(biz_id, api_token) for biz_id, api_token in tenants
+        ]
+        results = await run_many(
+            call, managers, concurrency or self.concurrency
+        )
+        return {
+            manager.manager.biz_id: result
+            for manager, result in zip(managers, results)
+        }
+
+    async def close(self):
+        clients = list(self.clients.values())
+        self.clients.clear()
+        self.managers.clear()
+        await asyncio.gather(*(client.aclose() for client in clients))
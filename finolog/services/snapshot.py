@@ -0,0 +1,160 @@
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import ujson
+
+from finolog.models.abc import BaseManager, Record
+from finolog.models.account import Account
+from finolog.models.company import Company
+from finolog.models.contractor import Contractor
+from finolog.services.manager import Manager
+
+logger = logging.getLogger(__name__)
+
+VERSION = 1
+
+ENTITIES: dict[str, type[Record]] = {
+    "accounts": Account,
+    "companies": Company,
+    "contractors": Contractor,
+}
+
+
+def fingerprint() -> str:
+    """Меняется вместе с набором полей моделей - старый снимок не читается"""
+    fields = ";".join(
+        f"{name}:{','.join(model.model_fields)}"
+        for name, model in ENTITIES.items()
+    )
+    return hashlib.sha1(fields.encode()).hexdigest()[:12]
+
+
+class Snapshot:
+    """
+    Снимок справочников бизнеса (счета, компании, контрагенты) на диске:
+    по файлу на biz_id, с версией формата и отпечатком моделей. load
+    раскладывает записи в кэши менеджеров ленивыми, без валидации;
+    refresh перечитывает справочники из API и перезаписывает снимок.
+
+    snapshot = Snapshot("/var/cache/finolog")
+    snapshot.load(manager)
+    task = snapshot.warm(manager)
+    """
+
+    def __init__(self, directory: str | os.PathLike):
+        self.directory = Path(directory)
+
+    def path(self, biz_id: int) -> Path:
+        return self.directory / f"{biz_id}.json"
+
+    def read(self, biz_id: int) -> dict[str, Any] | None:
+        try:
+            with open(self.path(biz_id), "rb") as file:
+                data = ujson.load(file)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            logger.warning("Повреждённый снимок %s", self.path(biz_id))
+            return None
+        if (
+            data.get("version") != VERSION
+            or data.get("fingerprint") != fingerprint()
+            or data.get("biz_id") != biz_id
+        ):
+            return None
+        return data
+
+    def write(self, biz_id: int, data: dict[str, Any]):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(biz_id)
+        temp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp, "w", encoding="utf-8") as file:
+            ujson.dump(data, file, ensure_ascii=False)
+        os.replace(temp, path)
+
+    def load(self, manager: Manager) -> float | None:
+        """
+        Заполняет кэши менеджеров из снимка; менеджерам без кэша он
+        создаётся. Возвращает время создания снимка или None, если
+        подходящего снимка нет.
+        """
+        data = self.read(manager.manager.biz_id)
+        if data is None:
+            return None
+        for name, model in ENTITIES.items():
+            entity: BaseManager = getattr(manager, name)
+            if entity.cache is None:
+                entity.cache = entity.make_cache()
+            records = [model.lazy(entity, row) for row in data[name]]
+            self.replace(entity, records, complete=name != "contractors")
+        return data["created"]
+
+    @staticmethod
+    def replace(entity: BaseManager, records: list, complete: bool):
+        """
+        Кладёт записи в кэш и выкидывает записи, которых больше нет.
+        complete - records совпадает с get_list() без аргументов.
+        """
+        cache = entity.cache
+        assert cache is not None
+        ids = {record.id for record in records}
+        for key in [key for key in cache.entries if key not in ids]:
+            del cache.entries[key]
+        if complete:
+            entity.store_list(entity.list_key({}), records)
+        else:
+            for record in records:
+                entity.store(record)
+
+    async def fetch(self, manager: Manager) -> dict[str, list]:
+        return {
+            "accounts": await manager.accounts.get_list(),
+            "companies": await manager.companies.get_list(),
+            "contractors": [
+                contractor
+                async for contractor in manager.contractors.iter_all()
+            ],
+        }
+
+    async def save(self, manager: Manager):
+        """Снимает справочники через менеджеры и пишет файл"""
+        await self.dump(manager.manager.biz_id, await self.fetch(manager))
+
+    async def dump(self, biz_id: int, entities: dict[str, list]):
+        data: dict[str, Any] = {
+            "version": VERSION,
+            "fingerprint": fingerprint(),
+            "biz_id": biz_id,
+            "created": time.time(),
+        }
+        for name, records in entities.items():
+            data[name] = [record.model_dump(mode="json") for record in records]
+        await asyncio.to_thread(self.write, biz_id, data)
+
+    async def refresh(self, manager: Manager):
+        """Перечитывает справочники из API мимо кэша и обновляет снимок"""
+        for name in ENTITIES:
+            getattr(manager, name).invalidate()
+        entities = await self.fetch(manager)
+        for name, records in entities.items():
+            entity = getattr(manager, name)
+            if entity.cache is not None:
+                self.replace(entity, records, complete=name != "contractors")
+        await self.dump(manager.manager.biz_id, entities)
+
+    def warm(self, manager: Manager) -> asyncio.Task:
+        """load и фоновый refresh; ошибки refresh только логируются"""
+        self.load(manager)
+
+        async def refresh():
+            try:
+                await self.refresh(manager)
+            except Exception:
+                logger.exception("Не удалось обновить снимок")
+
+        return asyncio.create_task(refresh())
@@ -0,0 +1,226 @@
+import bisect
+import datetime
+import math
+from decimal import Decimal
+from typing import Any, Callable, Iterable, Unpack
+
+from finolog.models.abc import Subscriber
+from finolog.models.transaction import (
+    Transaction,
+    TransactionGetArgs,
+    TransactionManager,
+)
+
+HASH_FILTERS = {
+    "category_ids": "category_id",
+    "category_id": "category_id",
+    "account_ids": "account_id",
+    "contractor_ids": "contractor_id",
+    "contractor_id": "contractor_id",
+    "requisite_ids": "requisite_id",
+    "requisite_id": "requisite_id",
+    "project_ids": "project_id",
+    "order_ids": "order_id",
+    "type": "type",
+    "status": "status",
+}
+RANGE_FILTERS = ("date", "report_date", "value", "base_value")
+PAGING = ("page", "pagesize")
+
+
+def as_date(value: Any) -> datetime.date:
+    return value.date() if isinstance(value, datetime.datetime) else value
+
+
+def as_decimal(value: Any) -> Decimal:
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+KEYS: dict[str, Callable[[Any], Any]] = {
+    "date": as_date,
+    "report_date": as_date,
+    "value": as_decimal,
+    "base_value": as_decimal,
+}
+
+
+def member(field: str, values: Iterable) -> Callable[[Transaction], bool]:
+    values = frozenset(values)
+    return lambda transaction: getattr(transaction, field) in values
+
+
+def between(field: str, low: Any, high: Any) -> Callable[[Transaction], bool]:
+    key = KEYS[field]
+    return lambda transaction: low <= key(getattr(transaction, field)) <= high
+
+
+class SortedIndex:
+    """Пары (ключ, id) в порядке ключа; выборка диапазона через bisect"""
+
+    def __init__(self):
+        self.items: list[tuple[Any, int]] = []
+
+    def add(self, key: Any, id: int):
+        bisect.insort(self.items, (key, id))
+
+    def extend(self, items: Iterable[tuple[Any, int]]):
+        self.items.extend(items)
+        self.items.sort()
+
+    def remove(self, key: Any, id: int):
+        index = bisect.bisect_left(self.items, (key, id))
+        if index < len(self.items) and self.items[index] == (key, id):
+            del self.items[index]
+
+    def bounds(self, low: Any, high: Any) -> tuple[int, int]:
+        return (
+            bisect.bisect_left(self.items, (low, -math.inf)),
+            bisect.bisect_right(self.items, (high, math.inf)),
+        )
+
+
+class TransactionStore(Subscriber):
+    """
+    Загруженные транзакции с индексами: хеш-индексы по id связанных
+    сущностей, типу и статусу, сортированные - по датам и суммам.
+    query принимает фильтры TransactionGetArgs и отвечает без запросов
+    к API, начиная с самого избирательного индекса. Подключённое к
+    TransactionManager хранилище обновляется при create/update/delete.
+    """
+
+    def __init__(self):
+        self.records: dict[int, Transaction] = {}
+        self.hashes: dict[str, dict[Any, set[int]]] = {
+            field: {} for field in set(HASH_FILTERS.values())
+        }
+        self.ranges = {field: SortedIndex() for field in RANGE_FILTERS}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    async def load(self, manager: TransactionManager, **args):
+        batch = []
+        async for transaction in manager.using("lazy").iter_all(**args):
+            batch.append(transaction)
+        self.add_many(batch)
+
+    def index(self, transaction: Transaction):
+        self.records[transaction.id] = transaction
+        for field, index in self.hashes.items():
+            index.setdefault(getattr(transaction, field), set()).add(
+                transaction.id
+            )
+
+    def add(self, transaction: Transaction):
+        self.remove(transaction.id)
+        if transaction.deleted_at is not None:
+            return
+        self.index(transaction)
+        for field, index in self.ranges.items():
+            index.add(KEYS[field](getattr(transaction, field)), transaction.id)
+
+    def add_many(self, transactions: Iterable[Transaction]):
+        """
+        Пакетная загрузка: сортированные индексы строятся один раз. Из
+        повторов одного id в пакете (строки сдвинулись между страницами)
+        остаётся последний.
+        """
+        added = []
+        latest = {transaction.id: transaction for transaction in transactions}
+        for transaction in latest.values():
+            if transaction.id in self.records:
+                self.add(transaction)
+            elif transaction.deleted_at is None:
+                self.index(transaction)
+                added.append(transaction)
+        for field, index in self.ranges.items():
+            index.extend(
+                (KEYS[field](getattr(transaction, field)), transaction.id)
+                for transaction in added
+            )
+
+    def remove(self, id: int):
+        transaction = self.records.pop(id, None)
+        if transaction is None:
+            return
+        for field, index in self.hashes.items():
+            ids = index[getattr(transaction, field)]
+            ids.discard(id)
+            if not ids:
+                del index[getattr(transaction, field)]
+        for field, index in self.ranges.items():
+            index.remove(KEYS[field](getattr(transaction, field)), id)
+
+    def query(
+        self, **args: Unpack[TransactionGetArgs.ArgDict]
+    ) -> list[Transaction]:
+        """
+        Транзакции, подходящие под все фильтры, по возрастанию даты.
+        Одиночное значение date/value означает равенство, пара -
+        диапазон с границами. page/pagesize режут результат как в API.
+        """
+        filters = TransactionGetArgs.adapter().validate_python(args)
+        unknown = (
+            filters.keys() - HASH_FILTERS.keys() - set(RANGE_FILTERS)
+        ) - {"ids", *PAGING}
+        if unknown:
+            raise ValueError(
+                f"Фильтры не поддерживаются: {', '.join(sorted(unknown))}"
+            )
+
+        # Кандидаты каждого фильтра: (оценка размера, id или срез
+        # индекса диапазона, проверка)
+        plans: list[
+            tuple[
+                int,
+                set[int] | tuple[str, int, int],
+                Callable[[Transaction], bool],
+            ]
+        ] = []
+        if "ids" in filters:
+            ids = set(filters["ids"]) & self.records.keys()
+            plans.append((len(ids), ids, member("id", ids)))
+        for name, field in HASH_FILTERS.items():
+            if name not in filters:
+                continue
+            values = filters[name]
+            if not isinstance(values, tuple):
+                values = (values,)
+            index = self.hashes[field]
+            ids = set().union(*(index.get(value, ()) for value in values))
+            plans.append((len(ids), ids, member(field, values)))
+        for field in RANGE_FILTERS:
+            if field not in filters:
+                continue
+            value = filters[field]
+            low, high = value if isinstance(value, tuple) else (value, value)
+            low, high = KEYS[field](low), KEYS[field](high)
+            start, stop = self.ranges[field].bounds(low, high)
+            plans.append(
+                (stop - start, (field, start, stop), between(field, low, high))
+            )
+
+        if not plans:
+            found = list(self.records.values())
+        else:
+            plans.sort(key=lambda plan: plan[0])
+            _, candidates, _ = plans[0]
+            driver: Iterable[int]
+            if isinstance(candidates, tuple):
+                field, start, stop = candidates
+                driver = [id for _, id in self.ranges[field].items[start:stop]]
+            else:
+                driver = candidates
+            checks = [check for _, _, check in plans[1:]]
+            found = [
+                transaction
+                for transaction in map(self.records.__getitem__, driver)
+                if all(check(transaction) for check in checks)
+            ]
+        found.sort(key=lambda t: (as_date(t.date), t.id))
+
+        if "pagesize" in filters or "page" in filters:
+            pagesize = filters.get("pagesize", 100)
+            start = (filters.get("page", 1) - 1) * pagesize
+            found = found[start : start + pagesize]
+        return found
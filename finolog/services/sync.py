@@ -0,0 +1,235 @@
+import datetime
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator
+
+import ujson
+
+from finolog.models.abc import PaginatedManager
+from finolog.models.transaction import Transaction
+from finolog.services.manager import Manager
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    biz_id INTEGER NOT NULL,
+    entity TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    date TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (biz_id, entity, id)
+);
+CREATE INDEX IF NOT EXISTS records_date ON records (biz_id, entity, date);
+CREATE TABLE IF NOT EXISTS sync_state (
+    biz_id INTEGER NOT NULL,
+    entity TEXT NOT NULL,
+    high_water TEXT NOT NULL,
+    PRIMARY KEY (biz_id, entity)
+);
+"""
+
+TIMESTAMP = "%Y-%m-%d %H:%M:%S"
+# Верхняя граница окна изменений: по часам клиента её брать нельзя - они
+# могут отставать от серверных или стоять в другом поясе
+OPEN_END = datetime.datetime(9999, 12, 31, 23, 59, 59)
+
+
+class SyncStore:
+    """Локальное зеркало сущностей бизнеса в SQLite"""
+
+    def __init__(self, path: str, biz_id: int):
+        self.biz_id = biz_id
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def high_water(self, entity: str) -> datetime.datetime | None:
+        row = self.db.execute(
+            "SELECT high_water FROM sync_state "
+            "WHERE biz_id = ? AND entity = ?",
+            (self.biz_id, entity),
+        ).fetchone()
+        return datetime.datetime.strptime(row[0], TIMESTAMP) if row else None
+
+    def set_high_water(self, entity: str, value: datetime.datetime):
+        self.db.execute(
+            "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)",
+            (self.biz_id, entity, value.strftime(TIMESTAMP)),
+        )
+
+    def upsert(self, entity: str, rows: Iterable[dict[str, Any]]) -> int:
+        cursor = self.db.executemany(
+            "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?)",
+            (
+                (
+                    self.biz_id,
+                    entity,
+                    row["id"],
+                    (row.get("date") or "")[:10] or None,
+                    ujson.dumps(row),
+                )
+                for row in rows
+            ),
+        )
+        return cursor.rowcount
+
+    def delete(self, entity: str, ids: Iterable[int]) -> int:
+        cursor = self.db.executemany(
+            "DELETE FROM records WHERE biz_id = ? AND entity = ? AND id = ?",
+            ((self.biz_id, entity, id) for id in ids),
+        )
+        return cursor.rowcount
+
+    def replace(self, entity: str, rows: list[dict[str, Any]]) -> int:
+        """Полностью заменяет набор записей сущности"""
+        self.db.execute(
+            "DELETE FROM records WHERE biz_id = ? AND entity = ?",
+            (self.biz_id, entity),
+        )
+        return self.upsert(entity, rows)
+
+    def get(self, entity: str, id: int) -> dict[str, Any] | None:
+        row = self.db.execute(
+            "SELECT data FROM records "
+            "WHERE biz_id = ? AND entity = ? AND id = ?",
+            (self.biz_id, entity, id),
+        ).fetchone()
+        return ujson.loads(row[0]) if row else None
+
+    def all(
+        self,
+        entity: str,
+        date_from: datetime.date | None = None,
+        date_to: datetime.date | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        query = "SELECT data FROM records WHERE biz_id = ? AND entity = ?"
+        params: list[Any] = [self.biz_id, entity]
+        if date_from is not None:
+            query += " AND date >= ?"
+            params.append(date_from.isoformat())
+        if date_to is not None:
+            query += " AND date <= ?"
+            params.append(date_to.isoformat())
+        for (data,) in self.db.execute(query + " ORDER BY date, id", params):
+            yield ujson.loads(data)
+
+
+def server_time(rows: Iterable[dict[str, Any]]) -> datetime.datetime | None:
+    """Самая поздняя отметка updated_at/deleted_at среди строк API"""
+    latest = None
+    for row in rows:
+        for name in ("updated_at", "deleted_at"):
+            value = row.get(name)
+            if not value:
+                continue
+            try:
+                stamp = datetime.datetime.strptime(value[:19], TIMESTAMP)
+            except ValueError:
+                continue
+            if latest is None or stamp > latest:
+                latest = stamp
+    return latest
+
+
+@dataclass
+class SyncReport:
+    upserted: dict[str, int] = field(default_factory=dict)
+    deleted: dict[str, int] = field(default_factory=dict)
+
+
+class SyncEngine:
+    """
+    Инкрементальная синхронизация бизнеса в SyncStore.
+
+    Транзакции докачиваются по updated_at/deleted_at начиная с отметки
+    прошлой синхронизации - самого позднего времени изменения, которое
+    вернул сервер, - с запасом overlap, без верхней границы.
+    У счетов, компаний, контрагентов и заказов фильтров по изменению нет,
+    поэтому они перезаписываются целиком.
+    """
+
+    overlap = datetime.timedelta(minutes=5)
+
+    def __init__(self, manager: Manager, store: SyncStore):
+        self.manager = manager
+        self.store = store
+
+    async def sync(self) -> SyncReport:
+        report = SyncReport()
+        await self.sync_transactions(report)
+        for manager in (
+            self.manager.accounts,
+            self.manager.companies,
+            self.manager.contractors,
+        ):
+            manager.invalidate()
+        for entity, records in (
+            ("account", await self.manager.accounts.get_list()),
+            ("company", await self.manager.companies.get_list()),
+            ("contractor", await self.collect(self.manager.contractors)),
+            ("order", await self.collect(self.manager.orders.using("raw"))),
+        ):
+            report.upserted[entity] = self.store.replace(
+                entity,
+                [
+                    record
+                    if isinstance(record, dict)
+                    else record.model_dump(mode="json")
+                    for record in records
+                ],
+            )
+            self.store.db.commit()
+        return report
+
+    async def sync_transactions(self, report: SyncReport):
+        since = self.store.high_water("transaction")
+        transactions = self.manager.transactions.using("raw")
+        changed: list[dict[str, Any]]
+        if since is None:
+            changed = await self.collect(transactions)
+            upserted = self.store.upsert("transaction", changed)
+            deleted = 0
+        else:
+            window = (since - self.overlap, OPEN_END)
+            changed = await self.collect(transactions, updated_at=window)
+            gone: list[dict[str, Any]] = await self.collect(
+                transactions, deleted_at=window
+            )
+            removed = [row["id"] for row in gone]
+            removed += [row["id"] for row in changed if row.get("deleted_at")]
+            upserted = self.store.upsert(
+                "transaction",
+                (row for row in changed if not row.get("deleted_at")),
+            )
+            deleted = self.store.delete("transaction", set(removed))
+            changed += gone
+        # Отметка - по часам сервера: клиентские могут отставать сильнее
+        # overlap, и тогда изменения на стыке окон терялись бы
+        mark = server_time(changed)
+        if mark is not None and (since is None or mark > since):
+            self.store.set_high_water("transaction", mark)
+        self.store.db.commit()
+        report.upserted["transaction"] = upserted
+        report.deleted["transaction"] = deleted
+
+    @staticmethod
+    async def collect(manager: PaginatedManager, **args) -> list[Any]:
+        return [record async for record in manager.iter_all(**args)]
+
+    def transaction(self, id: int) -> Transaction | None:
+        row = self.store.get("transaction", id)
+        if row is None:
+            return None
+        return self.manager.transactions.build(Transaction, row)
+
+    def transactions(
+        self,
+        date_from: datetime.date | None = None,
+        date_to: datetime.date | None = None,
+    ) -> list[Transaction]:
+        """Транзакции из локального зеркала, отсортированные по дате"""
+        return [
+            self.manager.transactions.build(Transaction, row)
+            for row in self.store.all("transaction", date_from, date_to)
+        ]
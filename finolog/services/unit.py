@@ -0,0 +1,114 @@
+from dataclasses import dataclass, field
+from typing import Any, Hashable, Literal
+
+from finolog.models.abc import BaseManager
+from finolog.models.bulk import BulkResult, run_many
+
+Kind = Literal["create", "update", "delete"]
+
+
+@dataclass(slots=True, eq=False)
+class Change:
+    """Отложенная операция; для create служит ссылкой на будущую запись"""
+
+    manager: BaseManager
+    kind: Kind
+    id: int | None = None
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+class UnitOfWork:
+    """
+    Копит create/update/delete и отправляет их при flush. Несколько
+    update одной записи сливаются в один PUT, update созданной здесь же
+    записи уходит в её POST, delete отменяет накопленные update, а пара
+    create + delete не отправляется вовсе.
+
+    async with UnitOfWork() as unit:
+        unit.update(manager.transactions, 15, category_id=3)
+        unit.update(manager.transactions, 15, contractor_id=7)
+
+    При выходе из блока неудачные операции поднимаются одним
+    ExceptionGroup; результаты последнего flush остаются в results.
+    """
+
+    concurrency: int = 8
+
+    def __init__(self, concurrency: int | None = None):
+        if concurrency is not None:
+            self.concurrency = concurrency
+        self.changes: dict[Hashable, Change] = {}
+        self.results: list[BulkResult] = []
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.changes.clear()
+            return
+        errors = [
+            result.error
+            for result in await self.flush()
+            if result.error is not None
+        ]
+        if errors:
+            raise ExceptionGroup("Не все изменения отправлены", errors)
+
+    def create(self, manager: BaseManager, **args) -> Change:
+        change = Change(manager, "create", args=args)
+        self.changes[change] = change
+        return change
+
+    def update(self, manager: BaseManager, target: int | Change, **args):
+        if isinstance(target, Change):
+            self.pending(target).args.update(args)
+            return
+        change = self.changes.get((manager, target))
+        if change is None:
+            self.changes[(manager, target)] = Change(
+                manager, "update", target, args
+            )
+        elif change.kind == "delete":
+            raise ValueError(f"Запись {target} уже удалена")
+        else:
+            change.args.update(args)
+
+    def delete(self, manager: BaseManager, target: int | Change):
+        if isinstance(target, Change):
+            del self.changes[self.pending(target)]
+            return
+        self.changes.pop((manager, target), None)
+        self.changes[(manager, target)] = Change(manager, "delete", target)
+
+    def pending(self, change: Change) -> Change:
+        if self.changes.get(change) is not change:
+            raise ValueError("Операция не ожидает отправки")
+        return change
+
+    def rollback(self):
+        self.changes.clear()
+
+    async def flush(self) -> list[BulkResult]:
+        """
+        Отправляет накопленное не более чем в concurrency запросов.
+        Операции выполняются независимо; неудачные не возвращаются в
+        очередь, их ошибки - в результатах.
+        """
+        changes = list(self.changes.values())
+        self.changes.clear()
+        self.results = await run_many(self.apply, changes, self.concurrency)
+        return self.results
+
+    @staticmethod
+    async def apply(change: Change) -> Any:
+        manager = change.manager
+        if change.kind == "create":
+            return await manager.create(**change.args)
+        assert change.id is not None
+        if change.kind == "update":
+            return await manager.update(change.id, **change.args)
+        return await manager.delete(change.id)
@@ -0,0 +1,195 @@
+"""Имитация API Finolog поверх httpx.MockTransport для тестов и бенчмарков"""
+import random
+import re
+from functools import partial
+from typing import Callable
+
+import httpx
+import ujson
+
+BASE_URL = "https://api.finolog.ru/"
+ROUTE = re.compile(
+    r"^/v1/biz/(?P<biz_id>\d+)(?P<path>/[a-z/]+?)(?:/(?P<id>\d+))?$"
+)
+
+
+def transaction(id: int, biz_id: int = 1, seed: int = 0) -> dict:
+    # Своё зерно у каждой записи: одна и та же транзакция одинакова
+    # при любом pagesize и не трогает глобальный random
+    value = round(random.Random(f"{seed}:{id}").uniform(-50_000, 50_000), 2)
+    return {
+        "id": id,
+        "date": f"2023-{id % 12 + 1:02}-{id % 28 + 1:02}",
+        "biz_id": biz_id,
+        "account_id": id % 17 + 1,
+        "type": "in" if value > 0 else "out",
+        "category_id": id % 41 + 1,
+        "contractor_id": id % 97 + 1 if id % 5 else None,
+        "description": f"Платёж по счёту №{id}",
+        "value": value,
+        "created_at": "2023-01-01 10:00:00",
+        "updated_at": "2023-01-02 11:30:00",
+        "created_by_id": 1,
+        "updated_by_id": 1,
+        "base_value": value,
+        "requisite_id": None,
+        "transfer_id": None,
+        "report_date": f"2023-{id % 12 + 1:02}-{id % 28 + 1:02}",
+        "status": "regular" if id % 7 else "planned",
+        "split_id": None,
+        "payment_id": None,
+        "schedule_id": None,
+        "source_id": None,
+        "project_id": id % 9 + 1 if id % 3 else None,
+        "is_splitted": False,
+        "deleted_at": None,
+        "deleted_by_id": None,
+        "order_id": None,
+        "is_multi_transfer": None,
+        "is_debt": False,
+        "has_comments": False,
+        "payment_number": None,
+        "vat": None,
+        "base_vat": None,
+        "autoeditor_id": None,
+        "original_schedule_id": None,
+        "original_schedule": None,
+    }
+
+
+def summary(company_id: int) -> list[dict]:
+    return [
+        {
+            "balance": 1000.5,
+            "base_balance": 1000.5,
+            "company_id": company_id,
+            "currency_id": 1,
+            "date": "2023-01-01",
+            "incoming": 10.0,
+            "type": status,
+        }
+        for status in ("regular", "planned")
+    ]
+
+
+def account(id: int, biz_id: int = 1) -> dict:
+    return {
+        "id": id,
+        "biz_id": biz_id,
+        "company_id": id % 3 + 1,
+        "created_at": "2023-01-01 10:00:00",
+        "created_by_id": 1,
+        "currency_id": 1,
+        "initital_balance": 0,
+        "name": f"Счёт {id}",
+        "planned_summary": summary(id % 3 + 1),
+        "summary": summary(id % 3 + 1),
+    }
+
+
+def company(id: int, biz_id: int = 1) -> dict:
+    return {
+        "id": id,
+        "name": f"ООО {id}",
+        "full_name": f"Общество с ограниченной ответственностью {id}",
+        "biz_id": biz_id,
+        "created_at": "2023-01-01 10:00:00",
+        "created_by_id": 1,
+        "planned_summary": summary(id),
+        "summary": summary(id),
+    }
+
+
+def contractor(id: int, biz_id: int = 1) -> dict:
+    return {"id": id, "name": f"Контрагент {id}"}
+
+
+def order(id: int, biz_id: int = 1) -> dict:
+    return {
+        "id": id,
+        "biz_id": biz_id,
+        "buyer_id": 1,
+        "buyer": {"id": 1},
+        "cost": 1500.0,
+        "created_at": "2023-01-01 10:00:00",
+        "created_by_id": 1,
+        "currency_id": 1,
+        "date": "2023-01-01 10:00:00",
+        "documents": [],
+        "number": f"A-{id}",
+        "package": {},
+        "paid": 0,
+        "paid_status": "unpaid",
+        "payment_url": f"https://pay.example/{id}",
+        "seller": {"id": 2},
+        "seller_id": 2,
+        "shipped_status": "not_shipped",
+        "token": f"t{id}",
+        "type": "in",
+    }
+
+
+FACTORIES = {
+    "/transaction": transaction,
+    "/account": account,
+    "/company": company,
+    "/contractor": contractor,
+    "/orders/order": order,
+}
+PAGINATED = frozenset(("/transaction", "/contractor", "/orders/order"))
+
+
+class FakeFinolog:
+    """
+    Отдаёт синтетические ответы: size записей на список (с учётом
+    page/pagesize для постраничных сущностей). Тела ответов кэшируются,
+    чтобы бенчмарк мерил клиент, а не генерацию данных. Записи зависят
+    только от seed и id.
+    """
+
+    def __init__(self, size: int = 1000, seed: int = 0):
+        self.size = size
+        self.requests = 0
+        self.bodies: dict[tuple, bytes] = {}
+        self.factories: dict[str, Callable[..., dict]] = {
+            **FACTORIES,
+            "/transaction": partial(transaction, seed=seed),
+        }
+
+    def body(self, key: tuple, payload) -> bytes:
+        body = self.bodies.get(key)
+        if body is None:
+            body = self.bodies[key] = ujson.dumps(payload).encode()
+        return body
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        match = ROUTE.match(request.url.path)
+        if match is None or match["path"] not in self.factories:
+            return httpx.Response(404)
+        path, factory = match["path"], self.factories[match["path"]]
+        biz_id = int(match["biz_id"])
+        if request.method == "DELETE":
+            return httpx.Response(200, json={"success": True})
+        if match["id"] is not None or request.method in ("POST", "PUT"):
+            id = int(match["id"] or self.size + 1)
+            return httpx.Response(
+                200,
+                content=self.body((biz_id, path, id), factory(id, biz_id)),
+            )
+        start, stop = 0, self.size
+        if path in PAGINATED and "pagesize" in request.url.params:
+            pagesize = int(request.url.params["pagesize"])
+            start = (int(request.url.params.get("page", 1)) - 1) * pagesize
+            stop = min(stop, start + pagesize)
+        rows = [factory(id, biz_id) for id in range(start + 1, stop + 1)]
+        return httpx.Response(
+            200, content=self.body((biz_id, path, start, stop), rows)
+        )
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=BASE_URL,
+            headers={"Api-Token": "benchmark"},
+            transport=httpx.MockTransport(self.handler),
+        )
@@ -0,0 +1,57 @@
+import asyncio
+from collections import Counter
+from typing import Callable
+
+import httpx
+import pytest
+
+from finolog.testing import BASE_URL, ROUTE, FakeFinolog
+
+Respond = Callable[[httpx.Request], httpx.Response | None]
+
+
+class Server:
+    """
+    FakeFinolog за MockTransport: пишет каждый запрос в log, считает
+    запросы в полёте по бизнесам и держит каждый delay секунд. respond
+    может подменить ответ, None - ответ FakeFinolog.
+    """
+
+    def __init__(
+        self,
+        size: int = 20,
+        delay: float = 0.0,
+        respond: Respond | None = None,
+    ):
+        self.fake = FakeFinolog(size)
+        self.delay = delay
+        self.respond = respond
+        self.log: list[httpx.Request] = []
+        self.inflight: Counter[int] = Counter()
+        self.peak: Counter[int] = Counter()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        match = ROUTE.match(request.url.path)
+        biz_id = 0 if match is None else int(match["biz_id"])
+        self.log.append(request)
+        self.inflight[biz_id] += 1
+        self.peak[biz_id] = max(self.peak[biz_id], self.inflight[biz_id])
+        try:
+            await asyncio.sleep(self.delay)
+            response = None if self.respond is None else self.respond(request)
+            if response is None:
+                response = self.fake.handler(request)
+            return response
+        finally:
+            self.inflight[biz_id] -= 1
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=BASE_URL, transport=httpx.MockTransport(self.handler)
+        )
+
+
+@pytest.fixture
+def server() -> Callable[..., Server]:
+    """Фабрика Server: server(size, delay=..., respond=...)"""
+    return Server
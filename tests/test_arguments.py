@@ -0,0 +1,53 @@
+import datetime
+from typing import NotRequired
+
+import pydantic
+import pytest
+from typing_extensions import TypedDict
+
+from finolog.models.arguments import Arguments
+from finolog.models.contractor import ItemArgs
+from finolog.models.transaction import TransactionGetArgs
+
+
+class OptionalArgs(Arguments):
+    class ArgDict(TypedDict):
+        query: NotRequired[str | None]
+        page: NotRequired[int]
+
+
+def test_as_params_applies_serializers():
+    args = TransactionGetArgs.model_validate(
+        {
+            "ids": [3, 1, 2],
+            "with_": "account",
+            "date": (
+                datetime.datetime(2023, 1, 1),
+                datetime.datetime(2023, 1, 31, 23, 59, 59),
+            ),
+            "report_date": datetime.datetime(2023, 2, 1, 12),
+            "value": 10,
+        }
+    )
+    assert args.as_params() == {
+        "ids": "3,1,2",
+        "with": "account",
+        "date": ["2023-01-01 00:00:00", "2023-01-31 23:59:59"],
+        "report_date": "2023-02-01 12:00:00",
+        "value": 10,
+    }
+
+
+def test_as_params_drops_none():
+    args = OptionalArgs.model_validate({"query": None, "page": 2})
+    assert args.as_params() == {"page": 2}
+
+
+def test_schema_compiled_once_and_validates():
+    assert ItemArgs.adapter() is ItemArgs.adapter()
+    assert ItemArgs.adapter() is not OptionalArgs.adapter()
+    assert ItemArgs.model_validate({"query": "x"}).as_params() == {
+        "query": "x"
+    }
+    with pytest.raises(pydantic.ValidationError):
+        TransactionGetArgs.model_validate({"type": "sideways"})
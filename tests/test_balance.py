@@ -0,0 +1,104 @@
+import asyncio
+import datetime
+import random
+from decimal import Decimal
+
+import httpx
+
+from finolog.models.transaction import TransactionStatus
+from finolog.services.balance import ZERO, BalanceIndex, DayTree
+from finolog.services.manager import Manager
+from finolog.testing import BASE_URL, FakeFinolog, transaction
+
+START = datetime.date(2022, 12, 1)
+DAYS = [START + datetime.timedelta(days=n) for n in range(0, 420, 7)]
+
+
+def expected(rows: dict[int, dict], account_id: int, date, status) -> Decimal:
+    total = ZERO
+    for row in rows.values():
+        if (
+            row["account_id"] == account_id
+            and row["status"] == status.value
+            and datetime.date.fromisoformat(row["date"]) <= date
+        ):
+            value = abs(Decimal(str(row["value"])))
+            total += value if row["type"] == "in" else -value
+    return total
+
+
+def test_day_tree_rebuilds_on_wide_range():
+    rnd = random.Random(2)
+    tree = DayTree(1000, size=8)
+    days: dict[int, Decimal] = {}
+    for _ in range(300):
+        day = rnd.randint(-5000, 5000)
+        amount = Decimal(rnd.randint(-100, 100))
+        tree.add(day, amount)
+        days[day] = days.get(day, ZERO) + amount
+    for day in range(-5100, 5100, 37):
+        assert tree.total(day) == sum(
+            (amount for d, amount in days.items() if d <= day), ZERO
+        )
+
+
+def test_balances_follow_writes():
+    api = FakeFinolog(300, seed=4)
+    rows = {id: transaction(id, seed=4) for id in range(1, 301)}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        id = request.url.path.rsplit("/", 1)[-1]
+        if request.method == "POST":
+            row = {**transaction(1001), "account_id": 2, "type": "in"}
+            row.update(value=250.5, date="2021-03-01")
+            return httpx.Response(200, json=row)
+        if request.method == "PUT":
+            # Счёт, дата и знак меняются: запись переезжает между деревьями
+            row = {**rows[int(id)], "account_id": 3, "type": "out"}
+            row.update(value=-99.99, date="2025-01-15")
+            return httpx.Response(200, json=row)
+        return api.handler(request)
+
+    async def main():
+        async with httpx.AsyncClient(
+            base_url=BASE_URL, transport=httpx.MockTransport(handler)
+        ) as session:
+            transactions = Manager(1, session=session).transactions
+            index = BalanceIndex()
+            await index.load(transactions, pagesize=45)
+            check(index)
+
+            index.attach(transactions)
+            created = await transactions.create(
+                from_id=2, value=250.5, date=datetime.date(2021, 3, 1)
+            )
+            rows[created.id] = created.model_dump(mode="json")
+            updated = await transactions.update(10, description="x")
+            rows[10] = updated.model_dump(mode="json")
+            await transactions.delete(11)
+            del rows[11]
+            check(index)
+
+            index.detach(transactions)
+            await transactions.delete(12)
+            assert 12 in index.entries
+
+    def check(index: BalanceIndex):
+        for account_id in (1, 2, 3, 5):
+            for status in TransactionStatus:
+                for date in (
+                    datetime.date(2021, 1, 1),
+                    *DAYS,
+                    datetime.date(2026, 1, 1),
+                ):
+                    assert index.balance(
+                        account_id, date, status
+                    ) == expected(rows, account_id, date, status)
+        start, end = datetime.date(2023, 3, 1), datetime.date(2023, 6, 30)
+        assert index.turnover(1, start, end) == expected(
+            rows, 1, end, TransactionStatus.REGULAR
+        ) - expected(
+            rows, 1, datetime.date(2023, 2, 28), TransactionStatus.REGULAR
+        )
+
+    asyncio.run(main())
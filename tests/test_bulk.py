@@ -0,0 +1,62 @@
+import asyncio
+import datetime
+
+import httpx
+
+from finolog.services.manager import Manager
+
+
+def missing_13(request: httpx.Request) -> httpx.Response | None:
+    if request.url.path.endswith("/13"):
+        return httpx.Response(404, json={"message": "Not found"})
+    return None
+
+
+def test_bulk_reports_each_item(server):
+    api = server(20, delay=0.01, respond=missing_13)
+
+    async def main():
+        async with api.client() as client:
+            transactions = Manager(1, session=client).transactions
+            updated = await transactions.update_many(
+                [{"id": id, "description": "x"} for id in range(10, 16)],
+                concurrency=2,
+            )
+            peaks = [api.peak[1]]
+            api.peak.clear()
+            deleted = await transactions.delete_many([12, 13, 14])
+            peaks.append(api.peak[1])
+            created = await transactions.create_many(
+                [
+                    {"from_id": 1, "value": 5, "date": datetime.date.today()}
+                    for _ in range(3)
+                ]
+            )
+            return peaks, updated, deleted, created
+
+    peaks, updated, deleted, created = asyncio.run(main())
+    assert peaks == [2, 3]
+    assert [result.args["id"] for result in updated] == list(range(10, 16))
+    assert [result.ok for result in updated] == [
+        True,
+        True,
+        True,
+        False,
+        True,
+        True,
+    ]
+    assert isinstance(updated[3].error, httpx.HTTPStatusError)
+    assert updated[3].result is None
+    assert [result.result.id for result in updated if result.ok] == [
+        10,
+        11,
+        12,
+        14,
+        15,
+    ]
+    assert [(result.args, result.ok) for result in deleted] == [
+        (12, True),
+        (13, False),
+        (14, True),
+    ]
+    assert all(result.ok for result in created)
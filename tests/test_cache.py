@@ -0,0 +1,60 @@
+import asyncio
+import copy
+
+from finolog.models.transaction import Transaction
+from finolog.services.manager import Manager
+from finolog.testing import FakeFinolog
+
+
+def test_cached_records_are_copies():
+    async def main():
+        api = FakeFinolog(10)
+        async with api.client() as session:
+            accounts = Manager(1, session=session, cache=True).accounts
+            first = await accounts.get(2)
+            first.name = "Изменён, но не сохранён"
+            second = await accounts.get(2)
+            listed = await accounts.get_list()
+            again = await accounts.get_list()
+            return api.requests, first, second, listed, again
+
+    requests, first, second, listed, again = asyncio.run(main())
+    assert requests == 2
+    assert second is not first and second.name != first.name
+    assert second.dirty == frozenset()
+    assert listed[0] is not again[0]
+    listed[0].name = "x"
+    assert again[0].dirty == frozenset()
+
+
+def test_record_writes_go_through_manager_once():
+    async def main():
+        async with FakeFinolog(10).client() as session:
+            transactions = Manager(1, session=session).transactions
+            invalidated = []
+            invalidate = transactions.invalidate
+
+            def counting(id=None):
+                invalidated.append(id)
+                invalidate(id)
+
+            transactions.invalidate = counting  # type: ignore[method-assign]
+            record = await transactions.get(3)
+            record.description = "Оплата"
+            await record.save()
+            await record.delete()
+            return invalidated
+
+    # По одному сбросу на save и delete: это делает менеджер, не запись
+    assert asyncio.run(main()) == [3, 3]
+
+
+def test_copy_keeps_lazy_state_separate():
+    row = {"id": 1, "value": 10, "description": "a"}
+    record = Transaction.lazy(None, row)
+    record.description = "b"
+    clone = copy.copy(record)
+    assert clone.dirty == {"description"}
+    clone.value = 5
+    assert record.dirty == {"description"}
+    assert record.value == 10 and clone.value == 5
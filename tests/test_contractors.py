@@ -0,0 +1,101 @@
+import asyncio
+import itertools
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from finolog.models.contractor import Contractor
+from finolog.services.contractors import ContractorIndex, normalize
+from finolog.services.manager import Manager
+from finolog.testing import BASE_URL, FakeFinolog
+
+
+def test_normalize():
+    assert normalize("ООО «Ромашка»") == "ромашка"
+    assert normalize("ИП Ёлкин  И.И.") == "елкин и и"
+    assert normalize("ООО") == "ооо"
+
+
+def test_get_or_create_many_creates_each_name_once():
+    api = FakeFinolog(50)
+    ids = itertools.count(1000)
+    posted: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            name = parse_qs(request.content.decode())["name"][0]
+            posted.append(name)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"id": next(ids), "name": name})
+        return api.handler(request)
+
+    async def main():
+        async with httpx.AsyncClient(
+            base_url=BASE_URL, transport=httpx.MockTransport(handler)
+        ) as session:
+            contractors = Manager(1, session=session).contractors
+            index = ContractorIndex()
+            await index.load(contractors, pagesize=20)
+            first, second = await asyncio.gather(
+                index.get_or_create_many(
+                    contractors, ["Контрагент 5", "ООО Ромашка", "ромашка"]
+                ),
+                index.get_or_create_many(contractors, ["Ромашка", "Другой"]),
+            )
+            return index, first, second
+
+    index, first, second = asyncio.run(main())
+    assert [c.id for c in first] == [5, 1000, 1000]
+    assert [c.id for c in second] == [1000, 1001]
+    assert posted == ["ООО Ромашка", "Другой"]
+    assert not index.creating
+    assert index.match("Контрагент 12x", threshold=0.5).name == "Контрагент 12"
+
+
+def test_failed_create_keeps_the_others():
+    api = FakeFinolog(10)
+    ids = itertools.count(1000)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            name = parse_qs(request.content.decode())["name"][0]
+            if name == "Сбой":
+                return httpx.Response(422, json={"message": "invalid"})
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"id": next(ids), "name": name})
+        return api.handler(request)
+
+    async def main():
+        async with httpx.AsyncClient(
+            base_url=BASE_URL, transport=httpx.MockTransport(handler)
+        ) as session:
+            contractors = Manager(1, session=session).contractors
+            index = ContractorIndex()
+            with pytest.raises(ExceptionGroup) as raised:
+                await index.get_or_create_many(
+                    contractors, ["Альфа", "Сбой", "Бета", "сбой"]
+                )
+            return index, raised.value
+
+    index, error = asyncio.run(main())
+    assert [type(e) for e in error.exceptions] == [httpx.HTTPStatusError]
+    assert sorted(c.name for c in index.contractors.values()) == [
+        "Альфа",
+        "Бета",
+    ]
+    assert not index.creating
+
+
+def test_name_winner_after_remove():
+    index = ContractorIndex()
+    for id in (7, 3, 5):
+        index.add(Contractor(None, id=id, name="ООО Ромашка"))
+    assert index.find("ромашка").id == 3
+    index.remove(3)
+    assert index.find("ромашка").id == 5
+    index.add(Contractor(None, id=5, name="Лютик"))
+    assert index.find("ромашка").id == 7
+    index.remove(7)
+    assert index.find("ромашка") is None
+    assert index.find("лютик").id == 5
@@ -0,0 +1,75 @@
+import asyncio
+import csv
+import io
+import json
+
+import pytest
+
+from finolog.services.manager import Manager
+from finolog.testing import FakeFinolog, transaction
+
+
+def export(*args, **kwargs) -> int:
+    async def main():
+        async with FakeFinolog(120).client() as session:
+            manager = Manager(1, session=session)
+            return await manager.transactions.export(*args, **kwargs)
+
+    return asyncio.run(main())
+
+
+def test_csv():
+    buffer = io.StringIO()
+    assert export(buffer, columns=["id", "value", "date"], pagesize=50) == 120
+    rows = list(csv.reader(io.StringIO(buffer.getvalue())))
+    assert rows[0] == ["id", "value", "date"]
+    assert [row[0] for row in rows[1:]] == [str(id) for id in range(1, 121)]
+
+
+def test_ndjson(tmp_path):
+    path = tmp_path / "transactions.ndjson"
+    assert export(path, "ndjson", columns=["id", "created_at"]) == 120
+    first = json.loads(path.read_text(encoding="utf-8").splitlines()[0])
+    assert first == {"id": 1, "created_at": "2023-01-01 10:00:00"}
+
+
+def test_unknown_columns():
+    with pytest.raises(ValueError):
+        export(io.StringIO(), columns=["id", "nope"])
+
+
+def test_parquet_round_trip(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "transactions.parquet"
+    columns = ["id", "value", "date", "is_splitted", "split_id"]
+    assert export(path, "parquet", columns, batch=50, pagesize=40) == 120
+    file = pq.ParquetFile(path)
+    groups = range(file.num_row_groups)
+    sizes = [file.metadata.row_group(group).num_rows for group in groups]
+    assert sizes == [50, 50, 20]
+    table = file.read()
+    assert str(table.schema.field("id").type) == "int64"
+    assert str(table.schema.field("value").type) == "double"
+    assert str(table.schema.field("is_splitted").type) == "bool"
+    assert str(table.schema.field("date").type) == "string"
+    rows = table.to_pylist()
+    assert [row["id"] for row in rows] == list(range(1, 121))
+    assert rows[0]["value"] == transaction(1)["value"]
+
+
+def test_order_export_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "orders.parquet"
+
+    async def main():
+        async with FakeFinolog(30).client() as session:
+            orders = Manager(1, session=session).orders
+            return await orders.export(
+                path, "parquet", ["id", "cost", "number", "buyer"], pagesize=7
+            )
+
+    assert asyncio.run(main()) == 30
+    rows = pq.read_table(path).to_pylist()
+    assert [row["id"] for row in rows] == list(range(1, 31))
+    assert rows[2]["number"] == "A-3"
+    assert json.loads(rows[0]["buyer"]) == {"id": 1}
@@ -0,0 +1,79 @@
+import asyncio
+import datetime
+from collections import defaultdict
+
+import pytest
+
+from finolog.services.manager import Manager
+from finolog.testing import FakeFinolog, transaction
+
+np = pytest.importorskip("numpy")
+
+from finolog.services.frame import TransactionFrame  # noqa: E402
+
+
+def test_fetch_builds_typed_columns():
+    async def main():
+        async with FakeFinolog(100).client() as session:
+            transactions = Manager(1, session=session).transactions
+            return await TransactionFrame.fetch(
+                transactions, chunk=40, pagesize=30
+            )
+
+    frame = asyncio.run(main())
+    rows = [transaction(id) for id in range(1, 101)]
+    assert len(frame) == 100
+    assert frame["id"].dtype == np.int64
+    assert frame["contractor_id"].dtype == np.int64
+    assert frame["value"].dtype == np.float64
+    assert frame["date"].dtype == np.dtype("datetime64[D]")
+    assert frame["type"].dtype.kind == "U"
+    assert frame["id"].tolist() == list(range(1, 101))
+    assert frame["value"].tolist() == [row["value"] for row in rows]
+    # Отсутствующий id хранится как 0
+    assert frame["contractor_id"][4] == 0 and rows[4]["contractor_id"] is None
+    assert frame["date"][0] == np.datetime64(rows[0]["date"])
+
+
+def test_where_and_group_sum():
+    rows = [transaction(id) for id in range(1, 201)]
+    frame = TransactionFrame.from_json(rows)
+
+    start, end = datetime.date(2023, 3, 1), datetime.date(2023, 6, 30)
+    found = frame.where(account_id=(1, 2), date=(start, end), type="in")
+    expected = [
+        row["id"]
+        for row in rows
+        if row["account_id"] in (1, 2)
+        and start <= datetime.date.fromisoformat(row["date"]) <= end
+        and row["type"] == "in"
+    ]
+    assert found["id"].tolist() == expected
+
+    keys, sums = frame.group_sum("account_id")
+    totals: dict[int, float] = defaultdict(float)
+    for row in rows:
+        totals[row["account_id"]] += row["value"]
+    assert keys.tolist() == sorted(totals)
+    assert sums == pytest.approx([totals[key] for key in sorted(totals)])
+
+    days, running = frame.cumsum()
+    assert running[-1] == pytest.approx(sum(row["value"] for row in rows))
+    assert list(days) == sorted(set(days))
+
+
+def test_where_date_set():
+    rows = [transaction(id) for id in range(1, 101)]
+    frame = TransactionFrame.from_json(rows)
+    days = [datetime.date(2023, 5, 5), "2023-10-10"]
+    wanted = ("2023-05-05", "2023-10-10")
+    expected = [row["id"] for row in rows if row["date"] in wanted]
+    assert expected
+    assert frame.where(date=days)["id"].tolist() == expected
+    assert frame.where(date=set(days))["id"].tolist() == expected
+
+
+def test_empty_frame():
+    frame = TransactionFrame.concat([])
+    assert len(frame) == 0
+    assert frame["date"].dtype == np.dtype("datetime64[D]")
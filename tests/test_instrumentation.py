@@ -0,0 +1,89 @@
+import asyncio
+import gzip
+import logging
+from functools import partial
+
+import httpx
+import pytest
+import ujson
+
+from finolog.repository import ApiManager, HistogramCollector, RequestEvent
+from finolog.repository.instrumentation import Histogram, endpoint
+from finolog.testing import FakeFinolog
+
+
+def failing(event: RequestEvent):
+    raise RuntimeError("hook")
+
+
+def gzipped(fake: FakeFinolog, request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/404"):
+        return httpx.Response(404, json={"message": "Not found"})
+    # Сжатое тело потоком, как из сети: размер - скачанные байты,
+    # а не длина распакованного ответа
+    body = gzip.compress(fake.handler(request).content)
+    return httpx.Response(
+        200,
+        headers={"Content-Encoding": "gzip"},
+        stream=httpx.ByteStream(body),
+    )
+
+
+def test_histogram_quantiles():
+    histogram = Histogram([1, 2, 4, 8])
+    for value in (0.5, 1.5, 1.5, 3, 100):
+        histogram.add(value)
+    assert histogram.counts == [1, 2, 1, 0, 1]
+    assert histogram.quantile(0.5) == 2
+    assert histogram.quantile(0.8) == 4
+    assert histogram.quantile(1.0) == 100
+    assert histogram.mean == pytest.approx(21.3)
+    assert Histogram([1]).quantile(0.5) == 0.0
+
+
+def test_endpoint_template():
+    assert endpoint("/transaction/15/split") == "/transaction/{id}/split"
+    assert endpoint("/transaction") == "/transaction"
+
+
+def test_hooks_see_every_request(server, caplog):
+    fake = server(30)
+    fake.respond = partial(gzipped, fake.fake)
+    collector = HistogramCollector()
+    events: list[RequestEvent] = []
+
+    async def main():
+        async with fake.client() as client:
+            api = ApiManager(
+                client,
+                biz_id=1,
+                coalesce=False,
+                hooks=[failing, collector, events.append],
+            )
+            rows = await api.request("GET", "/transaction", parse=len)
+            streamed = [row async for row in api.stream("/transaction")]
+            with pytest.raises(httpx.HTTPStatusError):
+                await api.request("GET", "/transaction/404")
+            return rows, streamed
+
+    with caplog.at_level(logging.ERROR):
+        rows, streamed = asyncio.run(main())
+    assert rows == len(streamed) == 30
+    assert len(caplog.records) == 3
+
+    listed, stream, missing = events
+    assert listed.size == stream.size
+    assert 0 < listed.size < len(ujson.dumps(streamed))
+    assert (listed.status, listed.error) == (200, None)
+    assert listed.build > 0
+    assert missing.status == 404
+    assert isinstance(missing.error, httpx.HTTPStatusError)
+
+    summary = collector.summary()
+    assert summary["GET /transaction"]["requests"] == 2
+    assert summary["GET /transaction"]["size"]["count"] == 2
+    assert summary["GET /transaction/{id}"]["errors"] == 1
+    assert summary["GET /transaction/{id}"]["statuses"] == {404: 1}
+    assert summary["GET /transaction/{id}"]["size"]["count"] == 0
+    collector.reset()
+    assert collector.summary() == {}
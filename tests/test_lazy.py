@@ -0,0 +1,62 @@
+import asyncio
+import datetime
+from urllib.parse import parse_qs
+
+import pydantic
+import pytest
+
+from finolog.models.transaction import Transaction
+from finolog.services.manager import Manager
+from finolog.testing import transaction
+
+
+def test_field_is_validated_on_first_access():
+    record = Transaction.lazy(None, {**transaction(3), "value": "abc"})
+    assert record.__dict__ == {"id": 3}
+    assert record.date == datetime.date(2023, 4, 4)
+    assert "date" in record.__dict__
+    assert "value" not in record.__dict__
+    # Ошибка в поле видна только при обращении к нему
+    with pytest.raises(pydantic.ValidationError):
+        record.value
+
+
+def test_missing_fields():
+    row = transaction(3)
+    del row["account_id"], row["contractor_id"]
+    record = Transaction.lazy(None, row)
+    assert record.contractor_id is None
+    with pytest.raises(AttributeError):
+        record.account_id
+
+
+def test_model_dump_materializes_every_field():
+    row = transaction(3)
+    record = Transaction.lazy(None, row)
+    record.description
+    assert record.model_dump() == Transaction(None, **row).model_dump()
+    assert record.__dict__.keys() == Transaction.model_fields.keys()
+    assert record._raw is None
+
+
+def test_lazy_record_is_saved(server):
+    api = server(20)
+
+    async def main():
+        async with api.client() as client:
+            transactions = Manager(1, session=client).transactions
+            record = await transactions.using("lazy").get(3)
+            assert record.__dict__ == {"id": 3}
+            record.description = "Оплата"
+            await record.save()
+            assert record.dirty == frozenset() and record._raw is None
+            await record.update(contractor_id=7)
+            return record
+
+    record = asyncio.run(main())
+    assert [r.method for r in api.log] == ["GET", "PUT", "PUT"]
+    assert parse_qs(api.log[1].content.decode()) == {
+        "description": ["Оплата"]
+    }
+    assert parse_qs(api.log[2].content.decode()) == {"contractor_id": ["7"]}
+    assert record.value == transaction(3)["value"]
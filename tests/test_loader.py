@@ -0,0 +1,90 @@
+import asyncio
+
+from finolog.services.loader import DataLoader
+
+
+class Batch:
+    def __init__(self):
+        self.calls: list[list[int]] = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, keys: list[int]) -> dict[int, str]:
+        self.calls.append(keys)
+        await self.release.wait()
+        return {key: str(key) for key in keys}
+
+
+def test_batches_keys_of_one_tick():
+    async def main():
+        batch = Batch()
+        batch.release.set()
+        loader = DataLoader(batch, max_batch=2)
+        values = await loader.load_many([1, 2, 3, 1])
+        assert values == ["1", "2", "3", "1"]
+        assert batch.calls == [[1, 2], [3]]
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_does_not_affect_others():
+    async def main():
+        batch = Batch()
+        loader = DataLoader(batch)
+        cancelled = asyncio.ensure_future(loader.load(1))
+        waiting = asyncio.ensure_future(loader.load(1))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        batch.release.set()
+        assert await waiting == "1"
+        assert cancelled.cancelled()
+        assert not loader.tasks
+        assert await loader.load(1) == "1"
+        assert batch.calls == [[1]]
+
+    errors = []
+    loop = asyncio.new_event_loop()
+    loop.set_exception_handler(lambda loop, context: errors.append(context))
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
+    assert errors == []
+
+
+def test_all_waiters_cancelled():
+    async def main():
+        batch = Batch()
+        loader = DataLoader(batch)
+        waiter = asyncio.ensure_future(loader.load(1))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        batch.release.set()
+        await asyncio.sleep(0.01)
+        assert not loader.tasks
+        assert await loader.load(1) == "1"
+
+    asyncio.run(main())
+
+
+def test_failed_batch_is_retried():
+    async def main():
+        calls = []
+
+        async def batch(keys):
+            calls.append(keys)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return {key: key for key in keys}
+
+        loader = DataLoader(batch)
+        try:
+            await loader.load(1)
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("ошибка batch не дошла до load")
+        assert await loader.load(1) == 1
+        assert calls == [[1], [1]]
+
+    asyncio.run(main())
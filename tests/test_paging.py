@@ -0,0 +1,61 @@
+import asyncio
+
+from finolog.services.manager import Manager
+
+
+def test_pages_in_order(server):
+    api = server(250)
+
+    async def main():
+        async with api.client() as client:
+            transactions = Manager(1, session=client).transactions
+            return [
+                transaction.id
+                async for transaction in transactions.iter_all(
+                    pagesize=100, prefetch=2
+                )
+            ]
+
+    assert asyncio.run(main()) == list(range(1, 251))
+    pages = [int(r.url.params["page"]) for r in api.log]
+    assert pages[:3] == [1, 2, 3]
+    assert len(pages) <= 4
+
+
+def test_short_first_page_is_one_request(server):
+    api = server(30)
+
+    async def main():
+        async with api.client() as client:
+            transactions = Manager(1, session=client).transactions
+            return [
+                transaction.id
+                async for transaction in transactions.iter_all(pagesize=100)
+            ]
+
+    assert asyncio.run(main()) == list(range(1, 31))
+    pages = [int(r.url.params["page"]) for r in api.log]
+    assert pages == [1]
+
+
+def test_break_cancels_prefetched_pages(server):
+    api = server(10_000, delay=0.01)
+
+    async def main():
+        async with api.client() as client:
+            transactions = Manager(1, session=client).transactions
+            ids = []
+            records = transactions.iter_all(pagesize=10, prefetch=4)
+            async for transaction in records:
+                ids.append(transaction.id)
+                if len(ids) == 15:
+                    break
+            await records.aclose()
+            leaked = asyncio.all_tasks() - {asyncio.current_task()}
+            return ids, leaked
+
+    ids, leaked = asyncio.run(main())
+    assert ids == list(range(1, 16))
+    assert leaked == set()
+    pages = [int(r.url.params["page"]) for r in api.log]
+    assert pages[:5] == [1, 2, 3, 4, 5] and len(pages) <= 6
@@ -0,0 +1,35 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from finolog.models.parsing import PoolParser
+from finolog.services.manager import Manager
+from finolog.testing import FakeFinolog
+
+
+def get_list(mode: str) -> list:
+    async def main():
+        async with FakeFinolog(60).client() as session:
+            transactions = Manager(1, session=session).transactions
+            transactions.parser = parser
+            return await transactions.using(mode).get_list(pagesize=60)
+
+    parser = PoolParser(ThreadPoolExecutor(2), chunk=10)
+    try:
+        return asyncio.run(main())
+    finally:
+        parser.close()
+
+
+def test_pool_builds_models():
+    records = get_list("model")
+    assert [record.id for record in records] == list(range(1, 61))
+    assert all("value" in record.__dict__ for record in records)
+    assert all(record._manager is not None for record in records)
+
+
+def test_pool_respects_record_mode():
+    lazy = get_list("lazy")
+    assert "value" not in lazy[0].__dict__
+    assert lazy[0].value == lazy[0].base_value
+    raw = get_list("raw")
+    assert isinstance(raw[0], dict) and raw[0]["id"] == 1
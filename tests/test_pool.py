@@ -0,0 +1,68 @@
+import asyncio
+
+import httpx
+
+from finolog.services.pool import ClientPool
+
+
+def missing_3(request: httpx.Request) -> httpx.Response | None:
+    if request.url.path.startswith("/v1/biz/3/"):
+        return httpx.Response(404, json={"message": "Not found"})
+    return None
+
+
+class MockPool(ClientPool):
+    """Клиенты пула ходят в один тестовый сервер"""
+
+    def __init__(self, server, **kwargs):
+        super().__init__(**kwargs)
+        self.server = server
+
+    def make_client(self, api_token: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"Api-Token": api_token},
+            transport=httpx.MockTransport(self.server.handler),
+        )
+
+
+def test_fan_out_limits_each_tenant(server):
+    api = server(10, delay=0.01, respond=missing_3)
+    pool = MockPool(api, tenant_concurrency=2)
+
+    async def call(manager):
+        return await asyncio.gather(
+            *(manager.accounts.get(id) for id in range(1, 9))
+        )
+
+    async def main():
+        try:
+            return await pool.fan_out(
+                {1: "a", 2: "a", 3: "b", 4: "c"}, call, concurrency=3
+            )
+        finally:
+            await pool.close()
+
+    results = asyncio.run(main())
+    assert list(results) == [1, 2, 3, 4]
+    assert [results[biz_id].ok for biz_id in results] == [
+        True,
+        True,
+        False,
+        True,
+    ]
+    assert isinstance(results[3].error, httpx.HTTPStatusError)
+    assert [a.id for a in results[4].result] == list(range(1, 9))
+    assert set(api.peak) == {1, 2, 3, 4}
+    assert max(api.peak.values()) == 2
+    assert not pool.clients
+
+
+def test_managers_share_client_by_token():
+    pool = ClientPool()
+    first, second = pool.manager(1, "a"), pool.manager(2, "a")
+    assert first.manager.session is second.manager.session
+    assert pool.manager(1, "a") is first
+    assert pool.manager(1, "b").manager.session is not first.manager.session
+    assert pool.manager(1, "b").manager.semaphore is first.manager.semaphore
+    asyncio.run(pool.close())
@@ -0,0 +1,73 @@
+import asyncio
+import datetime
+
+import httpx
+import pytest
+
+from finolog.services.manager import Manager
+from finolog.testing import transaction
+
+DENSE = datetime.date(2023, 3, 5)
+
+
+def make_rows() -> list[dict]:
+    rows = []
+    for id in range(1, 1201):
+        day = DENSE
+        if id % 2 == 0:
+            day = datetime.date(2023, 1, 1) + datetime.timedelta(id % 60)
+        rows.append({**transaction(id), "date": day.isoformat()})
+    return rows
+
+
+def by_date(rows: list[dict]):
+    """Отдаёт rows постранично с фильтром по диапазону date"""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        low, high = (value[:10] for value in params.get_list("date"))
+        found = [row for row in rows if low <= row["date"] <= high]
+        page = int(params.get("page", 1))
+        size = int(params.get("pagesize", 50))
+        return httpx.Response(
+            200, json=found[(page - 1) * size : page * size]
+        )
+
+    return respond
+
+
+def get_range(api, **args):
+    async def main():
+        async with api.client() as session:
+            manager = Manager(1, session=session)
+            return await manager.transactions.using("raw").get_range(**args)
+
+    return asyncio.run(main())
+
+
+def test_range_is_complete_and_bounded(server):
+    api = server(delay=0.001, respond=by_date(make_rows()))
+    rows = get_range(
+        api,
+        date=(datetime.datetime(2023, 1, 1), datetime.datetime(2023, 12, 31)),
+        limit=100,
+        concurrency=3,
+    )
+    assert sorted(row["id"] for row in rows) == list(range(1, 1201))
+    assert [row["date"] for row in rows] == sorted(row["date"] for row in rows)
+    assert api.peak[1] <= 3
+
+
+def test_single_date_is_one_day(server):
+    api = server(respond=by_date(make_rows()))
+    rows = get_range(api, date=datetime.datetime(2023, 3, 5), pagesize=100)
+    assert len(rows) == 600
+    assert {row["date"] for row in rows} == {DENSE.isoformat()}
+
+
+def test_range_arguments_are_checked(server):
+    api = server(respond=by_date(make_rows()))
+    with pytest.raises(ValueError):
+        get_range(api, description="x")
+    with pytest.raises(ValueError):
+        get_range(api, date=datetime.datetime(2023, 3, 5), page=2)
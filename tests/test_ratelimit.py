@@ -0,0 +1,157 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from finolog.repository.ratelimit import (
+    RateLimiter,
+    TokenBucket,
+    retry_after,
+)
+
+
+def response(status: int, **headers: str) -> httpx.Response:
+    return httpx.Response(status, headers=headers)
+
+
+def test_retry_after_seconds():
+    assert retry_after(response(429, **{"Retry-After": "2"})) == 2.0
+    assert retry_after(response(429)) is None
+    assert retry_after(response(429, **{"Retry-After": "soon"})) is None
+
+
+def test_retry_after_naive_date():
+    date = datetime.now(timezone.utc) + timedelta(seconds=60)
+    value = format_datetime(date.replace(tzinfo=None))
+    assert value.endswith("-0000")
+    delay = retry_after(response(429, **{"Retry-After": value}))
+    assert delay is not None and 50 < delay <= 60
+
+
+def test_retry_after_capped_by_max_backoff():
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        if len(attempts) == 1:
+            return response(429, **{"Retry-After": "3600"})
+        return response(200)
+
+    async def main():
+        limiter = RateLimiter(max_backoff=0.01)
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as session:
+            return await limiter.send(session, "GET", "http://test/")
+
+    result = asyncio.run(asyncio.wait_for(main(), 5))
+    assert result.status_code == 200
+    assert result.extensions["retries"] == 1
+
+
+def test_limiter_survives_several_event_loops():
+    limiter = RateLimiter(rate=1000, burst=1)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return response(200)
+
+    async def main():
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as session:
+            await asyncio.gather(
+                *(limiter.send(session, "GET", "http://test/") for _ in "abc")
+            )
+
+    asyncio.run(main())
+    asyncio.run(main())
+
+
+def flaky(statuses: list[int | None], attempts: list[str]):
+    """Отвечает статусами по порядку, None - сетевая ошибка"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request.method)
+        status = statuses[min(len(attempts), len(statuses)) - 1]
+        if status is None:
+            raise httpx.ConnectError("down", request=request)
+        return response(status)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_token_bucket_paces_requests():
+    async def main():
+        limiter = RateLimiter(rate=50, burst=1)
+        async with flaky([200], []) as session:
+            start = time.monotonic()
+            for _ in range(6):
+                await limiter.send(session, "GET", "http://test/")
+            return time.monotonic() - start
+
+    # Первый запрос из ведра, остальные пять - по одному за 1/50 с
+    assert asyncio.run(main()) >= 0.09
+
+
+def test_only_idempotent_methods_retry_server_errors():
+    async def main():
+        limiter = RateLimiter(backoff=0.001)
+        results = {}
+        for method in ("GET", "PUT", "POST"):
+            attempts: list[str] = []
+            async with flaky([502, 200], attempts) as session:
+                result = await limiter.send(session, method, "http://test/")
+            results[method] = (result.status_code, len(attempts))
+
+        attempts = []
+        async with flaky([None, 200], attempts) as session:
+            result = await limiter.send(session, "DELETE", "http://test/")
+        results["DELETE"] = (result.status_code, len(attempts))
+        with pytest.raises(httpx.ConnectError):
+            async with flaky([None, 200], []) as session:
+                await limiter.send(session, "POST", "http://test/")
+        return results
+
+    assert asyncio.run(main()) == {
+        "GET": (200, 2),
+        "PUT": (200, 2),
+        "POST": (502, 1),
+        "DELETE": (200, 2),
+    }
+
+
+def test_retries_are_bounded():
+    attempts: list[str] = []
+
+    async def main():
+        limiter = RateLimiter(retries=2, backoff=0.001)
+        async with flaky([503], attempts) as session:
+            return await limiter.send(session, "GET", "http://test/")
+
+    result = asyncio.run(main())
+    assert result.status_code == 503
+    assert result.extensions["retries"] == 2
+    assert len(attempts) == 3
+
+
+def test_throttle_halves_and_relax_restores():
+    async def main():
+        bucket = TokenBucket(rate=10)
+        bucket.throttle(0)
+        bucket.throttle(0)
+        assert bucket.rate == 2.5
+        for _ in range(40):
+            bucket.relax()
+            assert bucket.rate <= 10
+        assert bucket.rate == 10
+
+        limiter = RateLimiter(rate=10, backoff=0.001)
+        async with flaky([429, 200], []) as session:
+            await limiter.send(session, "GET", "http://test/")
+            return limiter.bucket("").rate
+
+    # 429 делит скорость пополам, успешный ответ прибавляет max_rate / 20
+    assert asyncio.run(main()) == 5.5
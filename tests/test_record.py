@@ -0,0 +1,70 @@
+import asyncio
+from urllib.parse import parse_qs
+
+import pytest
+
+from finolog.services.manager import Manager
+
+
+def test_save_sends_only_changes(server):
+    api = server(20)
+
+    async def main():
+        async with api.client() as client:
+            transactions = Manager(1, session=client).transactions
+            record = await transactions.get(3)
+            record.description = "Оплата"
+            record.contractor_id = 7
+            assert record.dirty == {"description", "contractor_id"}
+            await record.save()
+            assert record.dirty == frozenset()
+            await record.save()
+
+    asyncio.run(main())
+    assert [(r.method, r.url.path) for r in api.log] == [
+        ("GET", "/v1/biz/1/transaction/3"),
+        ("PUT", "/v1/biz/1/transaction/3"),
+    ]
+    assert parse_qs(api.log[1].content.decode()) == {
+        "description": ["Оплата"],
+        "contractor_id": ["7"],
+    }
+
+
+def test_clean_record_is_not_saved(server):
+    api = server(20)
+
+    async def main():
+        async with api.client() as client:
+            record = await Manager(1, session=client).transactions.get(3)
+            await record.save()
+
+    asyncio.run(main())
+    assert [r.method for r in api.log] == ["GET"]
+
+
+def test_read_only_field_is_rejected(server):
+    api = server(20)
+
+    async def main():
+        async with api.client() as client:
+            return await Manager(1, session=client).transactions.get(3)
+
+    record = asyncio.run(main())
+    with pytest.raises(ValueError):
+        record.biz_id = 2
+    assert record.biz_id == 1
+    assert record.dirty == frozenset()
+
+
+def test_update_does_not_share_fields_with_response(server):
+    api = server(20)
+
+    async def main():
+        async with api.client() as client:
+            record = await Manager(1, session=client).transactions.get(3)
+            response = await record.update(description="Оплата")
+            record.description = "Возврат"
+            return response
+
+    assert asyncio.run(main()).description == "Платёж по счёту №3"
@@ -0,0 +1,161 @@
+import asyncio
+
+import httpx
+import pytest
+
+from finolog.repository.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    Hedging,
+)
+
+REQUEST = httpx.Request("GET", "http://test/transaction")
+
+
+async def ok() -> httpx.Response:
+    return httpx.Response(200, request=REQUEST)
+
+
+async def unavailable() -> httpx.Response:
+    response = httpx.Response(503, request=REQUEST)
+    raise httpx.HTTPStatusError("503", request=REQUEST, response=response)
+
+
+async def cancelled() -> httpx.Response:
+    raise asyncio.CancelledError
+
+
+class Attempts:
+    """Попытки хеджирования по порядку: (задержка, статус)"""
+
+    def __init__(self, *plan: tuple[float, int]):
+        self.plan = list(plan)
+        self.started = 0
+        self.cancelled: list[int] = []
+
+    async def __call__(self) -> httpx.Response:
+        attempt = self.started
+        self.started += 1
+        delay, status = self.plan[attempt]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(attempt)
+            raise
+        return httpx.Response(status, request=REQUEST, json=attempt)
+
+
+def test_breaker_opens_and_serves_stale():
+    async def main():
+        breaker = CircuitBreaker(failures=2, reset=60, stale=8)
+        await breaker.call("/t", ok, key="a")
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await breaker.call("/t", unavailable, key="a")
+        assert breaker.circuit("/t").state == "open"
+        assert (await breaker.call("/t", unavailable, key="a")).is_success
+        with pytest.raises(CircuitOpenError):
+            await breaker.call("/t", unavailable, key="b")
+
+    asyncio.run(main())
+
+
+def test_cancellation_keeps_failure_count():
+    async def main():
+        breaker = CircuitBreaker(failures=2, reset=60)
+        with pytest.raises(httpx.HTTPStatusError):
+            await breaker.call("/t", unavailable)
+        with pytest.raises(asyncio.CancelledError):
+            await breaker.call("/t", cancelled)
+        circuit = breaker.circuit("/t")
+        assert (circuit.state, circuit.failures) == ("closed", 1)
+        with pytest.raises(httpx.HTTPStatusError):
+            await breaker.call("/t", unavailable)
+        assert circuit.state == "open"
+
+    asyncio.run(main())
+
+
+def test_cancelled_probe_reopens():
+    async def main():
+        breaker = CircuitBreaker(failures=1, reset=0)
+        with pytest.raises(httpx.HTTPStatusError):
+            await breaker.call("/t", unavailable)
+        with pytest.raises(asyncio.CancelledError):
+            await breaker.call("/t", cancelled)
+        assert breaker.circuit("/t").state == "open"
+        await breaker.call("/t", ok)
+        assert breaker.circuit("/t").state == "closed"
+
+    asyncio.run(main())
+
+
+def test_hedge_beats_slow_primary():
+    async def main():
+        hedging = Hedging(delay=0.01)
+        attempts = Attempts((10, 200), (0, 200))
+        response = await hedging.run("/t", attempts)
+        assert response.json() == 1
+        assert attempts.cancelled == [0]
+        stats = hedging.stats("/t")
+        assert (stats.requests, stats.hedged, stats.hedge_wins) == (1, 1, 1)
+
+    asyncio.run(main())
+
+
+def test_fast_primary_is_not_hedged():
+    async def main():
+        hedging = Hedging(delay=1)
+        attempts = Attempts((0, 200))
+        assert (await hedging.run("/t", attempts)).json() == 0
+        assert attempts.started == 1
+
+    asyncio.run(main())
+
+
+def test_failed_primary_falls_through_to_hedge():
+    async def main():
+        hedging = Hedging(delay=0.01)
+        attempts = Attempts((0.02, 503), (0.05, 200))
+        response = await hedging.run("/t", attempts)
+        assert response.json() == 1 and response.is_success
+        assert attempts.cancelled == []
+
+        attempts = Attempts((0.05, 200), (0, 502))
+        assert (await hedging.run("/t", attempts)).json() == 0
+
+    asyncio.run(main())
+
+
+def test_all_attempts_failed_returns_primary():
+    async def main():
+        hedging = Hedging(delay=0.01)
+        attempts = Attempts((0.02, 503), (0, 500))
+        response = await hedging.run("/t", attempts)
+        assert (response.status_code, response.json()) == (503, 0)
+        assert hedging.stats("/t").latency.count == 0
+
+    asyncio.run(main())
+
+
+def test_client_error_is_final():
+    async def main():
+        hedging = Hedging(delay=0.01)
+        attempts = Attempts((0.02, 404), (10, 200))
+        assert (await hedging.run("/t", attempts)).status_code == 404
+        assert attempts.cancelled == [1]
+
+    asyncio.run(main())
+
+
+def test_stale_responses_are_opt_in():
+    async def main():
+        breaker = CircuitBreaker(failures=1, reset=60)
+        await breaker.call("/t", ok, key="a")
+        assert not breaker.responses
+        with pytest.raises(httpx.HTTPStatusError):
+            await breaker.call("/t", unavailable, key="a")
+        with pytest.raises(CircuitOpenError):
+            await breaker.call("/t", ok, key="a")
+
+    asyncio.run(main())
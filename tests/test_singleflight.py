@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from finolog.models.transaction import TransactionGetArgs
+from finolog.repository import ApiManager, SingleFlight
+
+
+def test_identical_gets_share_one_request(server):
+    fake = server(10, delay=0.01)
+
+    async def main():
+        async with fake.client() as client:
+            api = ApiManager(client, biz_id=1)
+            args = TransactionGetArgs.model_validate({"pagesize": 5})
+            other = TransactionGetArgs.model_validate({"pagesize": 6})
+            results = await asyncio.gather(
+                *(api.request("GET", "/transaction", args) for _ in range(5)),
+                api.request("GET", "/transaction", other),
+            )
+            assert not api.inflight.calls
+            return results
+
+    results = asyncio.run(main())
+    log = [(r.method, str(r.url.query, "ascii")) for r in fake.log]
+    assert sorted(log) == [("GET", "pagesize=5"), ("GET", "pagesize=6")]
+    assert all(result == results[0] for result in results[:5])
+    # Каждый ожидающий разбирает тело сам и получает свой список
+    assert results[0] is not results[1]
+
+
+def test_writes_are_not_coalesced(server):
+    fake = server(10, delay=0.01)
+
+    async def main():
+        async with fake.client() as client:
+            api = ApiManager(client, biz_id=1)
+            for method in ("POST", "PUT", "DELETE"):
+                await asyncio.gather(
+                    *(api.request(method, "/transaction/1") for _ in range(3))
+                )
+
+    asyncio.run(main())
+    assert [r.method for r in fake.log] == ["POST"] * 3 + ["PUT"] * 3 + [
+        "DELETE"
+    ] * 3
+
+
+def test_error_reaches_every_waiter():
+    async def main():
+        flight = SingleFlight()
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            *(flight.do("key", failing) for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert calls == 1
+        assert [type(result) for result in results] == [RuntimeError] * 3
+        assert not flight.calls
+
+        async def ok():
+            return 42
+
+        assert await flight.do("key", ok) == 42
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_keeps_request_for_others():
+    async def main():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def call():
+            await release.wait()
+            return "done"
+
+        cancelled = asyncio.ensure_future(flight.do("key", call))
+        waiting = asyncio.ensure_future(flight.do("key", call))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        release.set()
+        assert await waiting == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+import ujson
+
+from finolog.services.manager import Manager
+from finolog.services.snapshot import VERSION, Snapshot
+from finolog.testing import FakeFinolog
+
+
+def test_round_trip(tmp_path):
+    snapshot = Snapshot(tmp_path)
+
+    async def main():
+        async with FakeFinolog(30).client() as session:
+            manager = Manager(1, session=session)
+            await snapshot.save(manager)
+            accounts = await manager.accounts.get_list()
+
+        api = FakeFinolog(30)
+        async with api.client() as session:
+            manager = Manager(1, session=session)
+            created = snapshot.load(manager)
+            cached = await manager.accounts.get_list()
+            contractor = await manager.contractors.get(7)
+            return api.requests, created, accounts, cached, contractor
+
+    requests, created, accounts, cached, contractor = asyncio.run(main())
+    assert requests == 0
+    assert created is not None
+    assert [a.model_dump() for a in cached] == [
+        a.model_dump() for a in accounts
+    ]
+    assert contractor.name == "Контрагент 7"
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [("version", VERSION + 1), ("fingerprint", "0" * 12), ("biz_id", 2)],
+)
+def test_mismatched_snapshot_is_refetched(tmp_path, field, value):
+    snapshot = Snapshot(tmp_path)
+    api = FakeFinolog(10)
+
+    async def main():
+        async with api.client() as session:
+            await snapshot.save(Manager(1, session=session))
+            data = ujson.loads(snapshot.path(1).read_bytes())
+            data[field] = value
+            snapshot.path(1).write_text(ujson.dumps(data))
+            api.requests = 0
+
+            manager = Manager(1, session=session, cache=True)
+            assert snapshot.load(manager) is None
+            await manager.accounts.get_list()
+            assert api.requests == 1
+
+            await snapshot.warm(manager)
+            assert snapshot.read(1) is not None
+            assert snapshot.load(Manager(1, session=session)) is not None
+
+    asyncio.run(main())
+
+
+def test_corrupt_or_missing_snapshot(tmp_path):
+    snapshot = Snapshot(tmp_path)
+    manager = Manager(1, session=FakeFinolog(1).client())
+    assert snapshot.load(manager) is None
+    snapshot.path(1).write_text("{")
+    assert snapshot.load(manager) is None
@@ -0,0 +1,10 @@
+from benchmarks.startup import probe
+
+# Бюджет времени холодного старта проверяет python -m benchmarks.startup:
+# замер по часам в общем наборе тестов зависит от загрузки машины
+
+
+def test_import_does_not_load_models():
+    imported, first, loaded = probe()
+    assert loaded == []
+    assert first >= imported
@@ -0,0 +1,73 @@
+import asyncio
+import datetime
+import random
+from decimal import Decimal
+
+import pytest
+
+from finolog.models.transaction import Transaction
+from finolog.services.manager import Manager
+from finolog.services.store import TransactionStore
+from finolog.testing import FakeFinolog, transaction
+
+
+def matches(record, filters: dict) -> bool:
+    checks = {
+        "account_ids": lambda ids: record.account_id in ids,
+        "category_ids": lambda ids: record.category_id in ids,
+        "date": lambda bounds: bounds[0] <= record.date <= bounds[1],
+        "value": lambda bounds: (
+            bounds[0] <= Decimal(str(record.value)) <= bounds[1]
+        ),
+    }
+    return all(checks[name](value) for name, value in filters.items())
+
+
+def test_query_matches_linear_scan():
+    async def main():
+        async with FakeFinolog(600).client() as session:
+            transactions = Manager(1, session=session).transactions
+            store = TransactionStore()
+            await store.load(transactions)
+            store.attach(transactions)
+            records = list(store.records.values())
+            accounts = sorted({record.account_id for record in records})
+            dates = sorted({record.date for record in records})
+            rnd = random.Random(1)
+            for _ in range(200):
+                filters: dict = {}
+                if rnd.random() < 0.5:
+                    filters["account_ids"] = tuple(rnd.sample(accounts, 2))
+                if rnd.random() < 0.5:
+                    filters["category_ids"] = (rnd.randint(1, 41),)
+                if rnd.random() < 0.5:
+                    filters["date"] = tuple(sorted(rnd.sample(dates, 2)))
+                if rnd.random() < 0.3:
+                    filters["value"] = (rnd.randint(-500, 0), 30_000)
+                expected = [r.id for r in records if matches(r, filters)]
+                found = [record.id for record in store.query(**filters)]
+                assert sorted(found) == sorted(expected), filters
+            removed = records[0].id
+            await transactions.delete(removed)
+            assert removed not in store.records
+            with pytest.raises(ValueError):
+                store.query(category_type="in")
+
+    asyncio.run(main())
+
+
+def test_add_many_keeps_last_duplicate():
+    first = transaction(1)
+    row = {**first, "date": "2023-02-02"}
+    moved = {**first, "date": "2024-05-05"}
+    store = TransactionStore()
+    store.add_many(
+        [Transaction.lazy(None, row), Transaction.lazy(None, moved)]
+    )
+    assert len(store.ranges["date"].items) == 1
+    found = store.query(
+        date=(datetime.datetime(2023, 1, 1), datetime.datetime(2023, 12, 31))
+    )
+    assert found == []
+    found = store.query(date=datetime.datetime(2024, 5, 5))
+    assert [t.id for t in found] == [1]
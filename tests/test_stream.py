@@ -0,0 +1,45 @@
+import asyncio
+
+import httpx
+
+from finolog.services.manager import Manager
+from finolog.testing import BASE_URL, FakeFinolog
+
+
+def test_stream_releases_tenant_semaphore():
+    async def main():
+        semaphore = asyncio.Semaphore(1)
+        async with FakeFinolog(30).client() as session:
+            manager = Manager(1, session=session, semaphore=semaphore)
+            ids = []
+            async for transaction in manager.transactions.stream(pagesize=30):
+                ids.append(transaction.id)
+                if len(ids) == 1:
+                    # Обращение к тому же бизнесу посреди потока
+                    account = await asyncio.wait_for(
+                        manager.accounts.get(1), 1
+                    )
+            assert semaphore._value == 1
+            return ids, account
+
+    ids, account = asyncio.run(main())
+    assert ids == list(range(1, 31))
+    assert account.id == 1
+
+
+def test_stream_releases_semaphore_on_error():
+    async def main():
+        semaphore = asyncio.Semaphore(1)
+        transport = httpx.MockTransport(lambda request: httpx.Response(500))
+        async with httpx.AsyncClient(
+            base_url=BASE_URL, transport=transport
+        ) as session:
+            manager = Manager(1, session=session, semaphore=semaphore)
+            try:
+                async for _ in manager.transactions.stream():
+                    pass
+            except httpx.HTTPStatusError:
+                pass
+            return semaphore._value
+
+    assert asyncio.run(main()) == 1
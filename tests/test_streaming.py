@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from finolog.repository.streaming import JsonArrayStream
+
+DATA = [{"id": 1, "name": "Ромашка"}, 12345, "x, ]", [1, 2.5], None, -7]
+
+
+def parse(payload: bytes, size: int) -> list:
+    stream = JsonArrayStream()
+    items = []
+    for start in range(0, len(payload), size):
+        items += stream.feed(payload[start : start + size])
+    return items + stream.feed(b"", final=True)
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1024])
+def test_chunked(size):
+    payload = json.dumps(DATA, ensure_ascii=False).encode()
+    assert parse(b" \n" + payload, size) == DATA
+
+
+def test_empty_array():
+    assert parse(b"[ ]", 1) == []
+
+
+def test_not_an_array():
+    with pytest.raises(ValueError):
+        parse(b'{"id": 1}', 4)
+
+
+def test_truncated():
+    with pytest.raises(ValueError):
+        parse(b'[{"id": 1}, ', 4)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [b"[1 2]", b"[,,1]", b"[1,,2]", b"[1,]", b"[,]", b"[1] x", b"[1]]"],
+)
+@pytest.mark.parametrize("size", [1, 3, 1024])
+def test_malformed(payload, size):
+    with pytest.raises(ValueError):
+        json.loads(payload)
+    with pytest.raises(ValueError):
+        parse(payload, size)
+
+
+def test_trailing_whitespace():
+    assert parse(b"[1, 2] \n", 1) == [1, 2]
+    assert parse(b"[1.5e3 , -2]", 2) == [1500.0, -2]
@@ -0,0 +1,140 @@
+import asyncio
+import datetime
+
+import httpx
+
+from finolog.services.manager import Manager
+from finolog.services.sync import (
+    SyncEngine,
+    SyncReport,
+    SyncStore,
+    server_time,
+)
+from finolog.testing import BASE_URL, FakeFinolog, transaction
+
+
+def test_server_time():
+    rows = [
+        {"updated_at": "2023-01-02 11:30:00", "deleted_at": None},
+        {"updated_at": None, "deleted_at": "2023-03-01 08:00:00"},
+        {"updated_at": "bad"},
+    ]
+    assert server_time(rows) == datetime.datetime(2023, 3, 1, 8)
+    assert server_time([]) is None
+
+
+def test_high_water_follows_server_clock():
+    windows = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        if params.get("page", "1") != "1":
+            return httpx.Response(200, json=[])
+        if "updated_at" in params:
+            windows.append(params.get_list("updated_at"))
+            row = {**transaction(2), "updated_at": "2023-05-01 12:00:00"}
+            return httpx.Response(200, json=[row])
+        if "deleted_at" in params:
+            return httpx.Response(200, json=[])
+        return httpx.Response(200, json=[transaction(1), transaction(2)])
+
+    async def main():
+        async with httpx.AsyncClient(
+            base_url=BASE_URL, transport=httpx.MockTransport(handler)
+        ) as session:
+            engine = SyncEngine(Manager(1, session=session), store)
+            await engine.sync_transactions(report)
+            await engine.sync_transactions(report)
+            await engine.sync_transactions(report)
+
+    store = SyncStore(":memory:", 1)
+    report = SyncReport()
+    asyncio.run(main())
+    assert [window[0] for window in windows] == [
+        "2023-01-02 11:25:00",
+        "2023-05-01 11:55:00",
+    ]
+    assert store.high_water("transaction") == datetime.datetime(2023, 5, 1, 12)
+
+
+class Server:
+    """Транзакции с фильтрами updated_at/deleted_at по диапазону"""
+
+    def __init__(self, rows: list[dict]):
+        self.rows = {row["id"]: row for row in rows}
+        self.fake = FakeFinolog(5)
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if not request.url.path.endswith("/transaction"):
+            return self.fake.handler(request)
+        params = request.url.params
+        if params.get("page", "1") != "1":
+            return httpx.Response(200, json=[])
+        rows = list(self.rows.values())
+        for name in ("updated_at", "deleted_at"):
+            if name in params:
+                low, high = params.get_list(name)
+                rows = [r for r in rows if low <= (r[name] or "") <= high]
+        if "deleted_at" not in params:
+            rows = [
+                row
+                for row in rows
+                if not row["deleted_at"] or "updated_at" in params
+            ]
+        return httpx.Response(200, json=rows)
+
+
+def stamp(value: datetime.datetime) -> str:
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def test_deletions_and_server_ahead_of_client():
+    server = Server([transaction(id) for id in range(1, 5)])
+    # Сервер на три часа впереди часов клиента
+    ahead = stamp(datetime.datetime.now() + datetime.timedelta(hours=3))
+
+    async def main():
+        async with httpx.AsyncClient(
+            base_url=BASE_URL, transport=httpx.MockTransport(server.handler)
+        ) as session:
+            engine = SyncEngine(Manager(1, session=session), store)
+            await engine.sync_transactions(SyncReport())
+            server.rows[1]["deleted_at"] = ahead
+            server.rows[2].update(deleted_at=ahead, updated_at=ahead)
+            server.rows[3].update(description="новое", updated_at=ahead)
+            report = SyncReport()
+            await engine.sync_transactions(report)
+            return report
+
+    store = SyncStore(":memory:", 1)
+    report = asyncio.run(main())
+    assert report.deleted["transaction"] == 2
+    # 4 не менялась, но её updated_at попадает в overlap
+    assert report.upserted["transaction"] == 2
+    assert [row["id"] for row in store.all("transaction")] == [3, 4]
+    assert store.get("transaction", 3)["description"] == "новое"
+    assert store.high_water("transaction") == datetime.datetime.strptime(
+        ahead, "%Y-%m-%d %H:%M:%S"
+    )
+
+
+def test_full_sync_mirrors_every_entity():
+    async def main():
+        async with FakeFinolog(12).client() as session:
+            engine = SyncEngine(Manager(1, session=session), store)
+            return engine, await engine.sync()
+
+    store = SyncStore(":memory:", 1)
+    engine, report = asyncio.run(main())
+    assert report.upserted == {
+        "transaction": 12,
+        "account": 12,
+        "company": 12,
+        "contractor": 12,
+        "order": 12,
+    }
+    assert store.get("order", 3)["number"] == "A-3"
+    assert store.get("contractor", 7)["name"] == "Контрагент 7"
+    assert store.get("account", 2)["name"] == "Счёт 2"
+    dates = [t.date for t in engine.transactions()]
+    assert dates == sorted(dates) and len(dates) == 12
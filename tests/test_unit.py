@@ -0,0 +1,53 @@
+import asyncio
+
+import httpx
+import pytest
+
+from finolog.services.manager import Manager
+from finolog.services.unit import UnitOfWork
+
+
+def delete_missing(request: httpx.Request) -> httpx.Response | None:
+    if request.method == "DELETE":
+        return httpx.Response(404, json={"message": "Not found"})
+    return None
+
+
+def test_updates_are_merged(server):
+    api = server(20, respond=delete_missing)
+
+    async def main():
+        async with api.client() as client:
+            transactions = Manager(1, session=client).transactions
+            async with UnitOfWork() as unit:
+                unit.update(transactions, 3, category_id=1)
+                unit.update(transactions, 3, contractor_id=7)
+                created = unit.create(transactions, from_id=1, value=5)
+                unit.delete(transactions, created)
+            return unit
+
+    unit = asyncio.run(main())
+    assert [(r.method, r.url.path) for r in api.log] == [
+        ("PUT", "/v1/biz/1/transaction/3")
+    ]
+    assert [result.ok for result in unit.results] == [True]
+
+
+def test_failures_are_raised_on_exit(server):
+    api = server(20, respond=delete_missing)
+    unit = UnitOfWork()
+
+    async def main():
+        async with api.client() as client:
+            transactions = Manager(1, session=client).transactions
+            async with unit:
+                unit.update(transactions, 3, category_id=1)
+                unit.delete(transactions, 4)
+
+    with pytest.raises(ExceptionGroup) as raised:
+        asyncio.run(main())
+    assert [type(e) for e in raised.value.exceptions] == [
+        httpx.HTTPStatusError
+    ]
+    assert [result.ok for result in unit.results] == [True, False]
+    assert len(unit) == 0